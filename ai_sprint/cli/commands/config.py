@@ -1,24 +1,52 @@
 """Configuration management commands for AI Sprint."""
 
+import copy
+import functools
+import os
+import re
 import sys
+import tempfile
+import tomllib
 from pathlib import Path
 
 import click
-import toml
 from rich.console import Console
-from rich.syntax import Syntax
-from rich.table import Table
 
+from ai_sprint.config.defaults import DEFAULT_CONFIG_BYTES
 from ai_sprint.utils.logging import get_logger, setup_logging
 
 console = Console()
 
+# Accepted spellings for boolean values in `config set`
+_TRUE = frozenset({"true", "yes", "1", "on"})
+_FALSE = frozenset({"false", "no", "0", "off"})
 
+
+@functools.cache
 def get_config_path() -> Path:
-    """Get the path to the AI Sprint configuration file."""
+    """Get the path to the AI Sprint configuration file.
+
+    Resolved once per process; call `get_config_path.cache_clear()` after
+    changing HOME.
+    """
     return Path.home() / ".ai-sprint" / "ai-sprint.toml"
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_config(path: str, mtime_ns: int) -> dict:
+    """Parse a TOML config file, memoized on its path and modification time.
+
+    Args:
+        path: Path to the config file
+        mtime_ns: File modification time, used only as part of the cache key
+
+    Returns:
+        dict: Parsed configuration data
+    """
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def load_config() -> dict:
     """Load the current configuration file.
 
@@ -37,24 +65,136 @@ def load_config() -> dict:
         )
 
     try:
-        return toml.load(config_path)
-    except toml.TomlDecodeError as e:
+        # Callers mutate the result, so hand out a copy of the cached parse
+        return copy.deepcopy(_parse_config(str(config_path), config_path.stat().st_mtime_ns))
+    except tomllib.TOMLDecodeError as e:
         raise ValueError(f"Invalid TOML in config file: {e}")
 
 
+def _read_section_raw(config_path: Path, section: str) -> str | None:
+    """Return the raw text of one top-level table, without parsing the file.
+
+    Reads from the `[section]` header up to the next header that is not one
+    of its sub-tables.
+
+    Args:
+        config_path: Path to the config file
+        section: Top-level table name
+
+    Returns:
+        The section text, or None if the file or header was not found
+    """
+    header = f"[{section}]"
+    subtable_prefixes = (f"[{section}.", f"[[{section}.")
+    lines: list[str] = []
+
+    try:
+        with open(config_path, encoding="utf-8") as f:
+            for line in f:
+                stripped = line.lstrip()
+                if lines:
+                    if stripped.startswith("[") and not stripped.startswith(subtable_prefixes):
+                        break
+                    lines.append(line)
+                elif stripped.split("#", 1)[0].strip() == header:
+                    lines.append(line)
+    except OSError:
+        return None
+
+    return "".join(lines) or None
+
+
+def _atomic_write(config_path: Path, data: bytes) -> None:
+    """Write a file atomically via a synced temp file and os.replace().
+
+    Readers see either the old or the new contents, never a partial write.
+    The existing file's permissions are kept.
+
+    Args:
+        config_path: Destination path
+        data: File contents
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=config_path.parent, prefix=".ai-sprint.", suffix=".toml"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_path, config_path.stat().st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def save_config(config: dict) -> None:
     """Save configuration to file.
 
     Args:
         config: Configuration dictionary to save
     """
+    import tomli_w
+
     config_path = get_config_path()
 
     try:
-        with open(config_path, "w") as f:
-            toml.dump(config, f)
+        _atomic_write(config_path, tomli_w.dumps(config).encode())
     except Exception as e:
         raise RuntimeError(f"Failed to save config: {e}")
+    finally:
+        _parse_config.cache_clear()
+
+
+def _inplace_set(config_path: Path, section: str, key: str, value: object) -> bool:
+    """Rewrite a single existing `key = value` line inside `[section]`.
+
+    Only the value is replaced, so comments and formatting elsewhere in the
+    file are preserved. The edited text is re-parsed before writing and the
+    edit is abandoned if the result does not hold the expected value.
+
+    Args:
+        config_path: Path to the config file
+        section: Top-level table name
+        key: Key within the table
+        value: New value
+
+    Returns:
+        True if the file was updated, False if the key line was not found
+    """
+    import tomli_w
+
+    value_repr = tomli_w.dumps({"v": value})[len("v = "):].rstrip("\n")
+
+    pattern = re.compile(
+        rf"(^\[{re.escape(section)}\][^\[]*?^{re.escape(key)}[ \t]*=[ \t]*)"
+        rf"[^#\n]*?([ \t]*#[^\n]*)?$",
+        re.M | re.S,
+    )
+
+    text = config_path.read_text()
+    new_text, count = pattern.subn(
+        lambda m: m.group(1) + value_repr + (m.group(2) or ""), text, count=1
+    )
+    if not count:
+        return False
+
+    try:
+        if tomllib.loads(new_text)[section][key] != value:
+            return False
+    except (tomllib.TOMLDecodeError, KeyError):
+        return False
+
+    _atomic_write(config_path, new_text.encode())
+    _parse_config.cache_clear()
+    return True
 
 
 @click.group()
@@ -71,17 +211,35 @@ def config() -> None:
 )
 def show(section: str | None) -> None:
     """Display current configuration."""
+    import tomli_w
+    from rich.syntax import Syntax
+
     setup_logging()
     logger = get_logger(__name__)
 
     try:
-        config_data = load_config()
         config_path = get_config_path()
 
+        # Parse only the requested section when its header can be found
+        section_data = None
+        if section:
+            raw = _read_section_raw(config_path, section)
+            if raw is not None:
+                try:
+                    section_data = tomllib.loads(raw).get(section)
+                except tomllib.TOMLDecodeError:
+                    pass  # Fall back to the full parse below
+
+        config_data = None
+        if section_data is None:
+            config_data = load_config()
+
         console.print(f"[bold cyan]Configuration:[/bold cyan] {config_path}")
         console.print()
 
-        if section:
+        if section_data is not None:
+            toml_str = tomli_w.dumps({section: section_data})
+        elif section:
             # Show specific section
             if section not in config_data:
                 console.print(f"[red]✗ Section '{section}' not found in configuration[/red]")
@@ -89,10 +247,10 @@ def show(section: str | None) -> None:
                 sys.exit(1)
 
             section_data = {section: config_data[section]}
-            toml_str = toml.dumps(section_data)
+            toml_str = tomli_w.dumps(section_data)
         else:
             # Show full config
-            toml_str = toml.dumps(config_data)
+            toml_str = tomli_w.dumps(config_data)
 
         # Display with syntax highlighting
         syntax = Syntax(toml_str, "toml", theme="monokai", line_numbers=False)
@@ -156,9 +314,10 @@ def set_value(key: str, value: str) -> None:
 
             if isinstance(existing_value, bool):
                 # Boolean conversion
-                if value.lower() in ("true", "yes", "1", "on"):
+                lowered = value.lower()
+                if lowered in _TRUE:
                     converted_value = True
-                elif value.lower() in ("false", "no", "0", "off"):
+                elif lowered in _FALSE:
                     converted_value = False
                 else:
                     console.print(f"[red]✗ Invalid boolean value: {value}[/red]")
@@ -190,9 +349,10 @@ def set_value(key: str, value: str) -> None:
                     converted_value = float(value)
                 except ValueError:
                     # Try bool
-                    if value.lower() in ("true", "yes", "1", "on"):
+                    lowered = value.lower()
+                    if lowered in _TRUE:
                         converted_value = True
-                    elif value.lower() in ("false", "no", "0", "off"):
+                    elif lowered in _FALSE:
                         converted_value = False
                     else:
                         # Default to string
@@ -202,8 +362,9 @@ def set_value(key: str, value: str) -> None:
         old_value = config_data[section].get(setting, "<not set>")
         config_data[section][setting] = converted_value
 
-        # Save
-        save_config(config_data)
+        # Save (edit the line in place when possible to keep user comments)
+        if not _inplace_set(get_config_path(), section, setting, converted_value):
+            save_config(config_data)
 
         console.print(f"[green]✓ Updated {section}.{setting}[/green]")
         console.print(f"  Old: {old_value}")
@@ -248,51 +409,12 @@ def reset(confirm: bool) -> None:
                 console.print("Cancelled.")
                 return
 
-        # Default configuration
-        default_config = """# AI Sprint Configuration
-# Edit this file to customize system behavior
-
-[general]
-database_path = "~/.ai-sprint/beads.db"
-log_level = "INFO"
-log_file = "~/.ai-sprint/logs/ai-sprint.log"
-
-[agents]
-max_developers = 3
-max_testers = 3
-polling_interval_seconds = 30
-
-[timeouts]
-agent_heartbeat_seconds = 60
-agent_hung_seconds = 300
-task_max_duration_seconds = 7200
-merge_timeout_seconds = 300
-
-[quality]
-coverage_threshold = 80
-mutation_threshold = 80
-complexity_flag = 10
-complexity_max = 15
-
-[security]
-critical_cve_max = 0
-high_cve_max = 0
-medium_cve_max = 5
-
-[models]
-manager = "opus"
-cab = "haiku"
-refinery = "sonnet"
-librarian = "sonnet"
-developer = "sonnet"
-tester = "haiku"
-"""
-
         # Ensure config directory exists
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write default config
-        config_path.write_text(default_config)
+        _atomic_write(config_path, DEFAULT_CONFIG_BYTES)
+        _parse_config.cache_clear()
 
         console.print(f"[green]✓ Configuration reset to defaults[/green]")
         console.print(f"  Config file: {config_path}")
@@ -1,21 +1,72 @@
 """Health check command for AI Sprint system."""
 
+import functools
 import json
+import os
+import re
 import shutil
+import sqlite3
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
 from pathlib import Path
 
 import click
+from packaging.version import InvalidVersion, Version
 from rich.console import Console
 from rich.table import Table
 
-from ai_sprint.config.settings import Settings
-from ai_sprint.services.state_manager import get_db
 from ai_sprint.utils.logging import get_logger, setup_logging
 
 console = Console()
 
+# First dotted version number in `<command> --version` output
+_VERSION_RE = re.compile(rb"\d+(?:\.\d+){1,3}")
+
+
+# Minimum versions for required system commands
+REQUIRED_DEPS: dict[str, str] = {
+    "python3": "3.11",
+    "git": "2.20",
+    "tmux": "3.0",
+}
+
+REQUIRED_PACKAGES: list[str] = [
+    "click",
+    "gitpython",
+    "libtmux",
+    "pydantic",
+    "pydantic-settings",
+    "rich",
+    "tomli-w",
+]
+
+
+@functools.cache
+def _config_dir() -> Path:
+    """Return the AI Sprint config directory, resolved once per process."""
+    return Path.home() / ".ai-sprint"
+
+
+@functools.cache
+def _path_index() -> dict[str, str]:
+    """Map file names to the first $PATH directory containing them.
+
+    Only names are read, one listdir per directory, so a lookup miss means
+    the command is absent without any stat or subprocess. Directories are
+    merged last to first so earlier PATH entries win, matching shell
+    lookup order.
+    """
+    index: dict[str, str] = {}
+    for directory in reversed(os.environ.get("PATH", "").split(os.pathsep)):
+        directory = directory or "."
+        try:
+            index.update(dict.fromkeys(os.listdir(directory), directory))
+        except OSError:
+            continue
+    return index
+
 
 def check_command_version(command: str, min_version: str | None = None) -> dict:
     """Check if a command exists and optionally verify minimum version.
@@ -23,30 +74,53 @@ def check_command_version(command: str, min_version: str | None = None) -> dict:
     Returns:
         dict with keys: available (bool), version (str|None), meets_minimum (bool|None)
     """
-    if not shutil.which(command):
+    directory = _path_index().get(command)
+    command_path = None
+    if directory is not None:
+        command_path = os.path.join(directory, command)
+        if not (os.path.isfile(command_path) and os.access(command_path, os.X_OK)):
+            # The first match is not runnable; let a full search find a later one
+            command_path = shutil.which(command)
+    if not command_path:
         return {"available": False, "version": None, "meets_minimum": None}
 
+    try:
+        mtime = os.path.getmtime(command_path)
+    except OSError:
+        mtime = 0.0
+
+    return dict(_probe_command(command, command_path, mtime, min_version))
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_command(
+    command: str,
+    command_path: str,
+    mtime: float,
+    min_version: str | None,
+) -> dict:
+    """Run `<command> --version` once per (command, resolved path, mtime).
+
+    The path and mtime are only part of the cache key, so an upgraded or
+    relocated binary is probed again.
+    """
     try:
         # Try to get version
         result = subprocess.run(
             [command, "--version"],
             capture_output=True,
-            text=True,
             timeout=5,
         )
 
-        version_output = result.stdout + result.stderr
-        version = version_output.split()[1] if version_output else "unknown"
+        # Match on raw bytes; some tools print their version to stderr
+        match = _VERSION_RE.search(result.stdout) or _VERSION_RE.search(result.stderr)
+        version = match.group(0).decode() if match else "unknown"
 
-        # Simple version comparison if needed
         meets_minimum = None
-        if min_version:
+        if min_version and match:
             try:
-                # Basic version comparison (works for X.Y.Z format)
-                current_parts = [int(x) for x in version.split(".")[:3]]
-                min_parts = [int(x) for x in min_version.split(".")[:3]]
-                meets_minimum = current_parts >= min_parts
-            except (ValueError, IndexError):
+                meets_minimum = Version(version) >= Version(min_version)
+            except InvalidVersion:
                 meets_minimum = None  # Can't determine
 
         return {
@@ -59,41 +133,170 @@ def check_command_version(command: str, min_version: str | None = None) -> dict:
         return {"available": True, "version": "unknown", "meets_minimum": None}
 
 
+def check_command_versions(commands: list[tuple[str, str | None]]) -> dict[str, dict]:
+    """Check several commands concurrently.
+
+    The probes are dominated by process startup rather than CPU, so a thread
+    pool runs them in parallel.
+
+    Args:
+        commands: (command, min_version) pairs
+
+    Returns:
+        dict mapping command name to the check_command_version() result
+    """
+    _path_index()  # Build the PATH index once before the workers race for it
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(lambda probe: check_command_version(*probe), commands)
+        return dict(zip((cmd for cmd, _ in commands), results))
+
+
 def check_python_packages(packages: list[str]) -> dict[str, dict]:
     """Check if Python packages are installed.
 
+    Reads installed distribution metadata in-process rather than running pip.
+    Packages that metadata cannot find are re-checked against a single
+    `pip list` call, which covers installs that metadata does not see.
+
     Returns:
         dict mapping package name to {available: bool, version: str|None}
     """
     results = {}
+    missing = []
 
     for package in packages:
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "show", package],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode == 0:
-                # Parse version from output
-                for line in result.stdout.splitlines():
-                    if line.startswith("Version:"):
-                        version = line.split(":", 1)[1].strip()
-                        results[package] = {"available": True, "version": version}
-                        break
-                else:
-                    results[package] = {"available": True, "version": "unknown"}
-            else:
-                results[package] = {"available": False, "version": None}
-
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+            results[package] = {"available": True, "version": metadata.version(package)}
+        except metadata.PackageNotFoundError:
             results[package] = {"available": False, "version": None}
+            missing.append(package)
+
+    if missing:
+        installed = _pip_list_versions()
+        for package in missing:
+            version = installed.get(_normalize_dist_name(package))
+            if version:
+                results[package] = {"available": True, "version": version}
 
     return results
 
 
+def _normalize_dist_name(name: str) -> str:
+    """Normalize a distribution name for comparison (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _pip_list_versions() -> dict[str, str]:
+    """Return installed package versions from one `pip list --format=json` call.
+
+    Returns:
+        dict mapping normalized package name to version; empty if pip fails
+    """
+    try:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "list",
+                "--format=json",
+                "--disable-pip-version-check",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=15,
+        )
+        return {
+            _normalize_dist_name(pkg["name"]): pkg["version"]
+            for pkg in json.loads(result.stdout)
+        }
+    except (subprocess.SubprocessError, OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def _section_table(title: str) -> Table:
+    """Create a borderless status table for one health-check section."""
+    table = Table(
+        title=f"[bold cyan]{title}[/bold cyan]",
+        title_justify="left",
+        show_header=False,
+        box=None,
+        pad_edge=False,
+    )
+    table.add_column(width=1)
+    table.add_column()
+    table.add_column()
+    table.add_column(style="dim")
+    return table
+
+
+def _system_deps_table(required_deps: dict[str, str], command_info: dict[str, dict]) -> Table:
+    """Build the System Dependencies table.
+
+    Args:
+        required_deps: Mapping of command name to minimum version
+        command_info: Probe results from check_command_versions()
+
+    Returns:
+        Rendered-ready Rich Table
+    """
+    table = _section_table("System Dependencies")
+
+    for cmd, min_ver in required_deps.items():
+        info = command_info[cmd]
+        if not info["available"]:
+            table.add_row("[red]✗[/red]", cmd, "not found", f"need >= {min_ver}")
+        elif info["meets_minimum"] is False:
+            table.add_row("[yellow]⚠[/yellow]", cmd, info["version"], f"need >= {min_ver}")
+        else:
+            table.add_row("[green]✓[/green]", cmd, info["version"], "OK")
+
+    return table
+
+
+def _packages_table(pkg_info: dict[str, dict]) -> Table:
+    """Build the Python Packages table.
+
+    Args:
+        pkg_info: Results from check_python_packages()
+
+    Returns:
+        Rendered-ready Rich Table
+    """
+    table = _section_table("Python Packages")
+
+    for pkg, info in pkg_info.items():
+        if info["available"]:
+            table.add_row("[green]✓[/green]", pkg, info["version"], "")
+        else:
+            table.add_row("[red]✗[/red]", pkg, "not installed", "")
+
+    return table
+
+
+def _optional_tools_table(optional_tools: dict[str, str | None], command_info: dict[str, dict]) -> Table:
+    """Build the Optional Tools table.
+
+    Args:
+        optional_tools: Optional command names
+        command_info: Probe results from check_command_versions()
+
+    Returns:
+        Rendered-ready Rich Table
+    """
+    table = _section_table("Optional Tools")
+
+    for tool in optional_tools:
+        info = command_info[tool]
+        if info["available"]:
+            table.add_row("[green]✓[/green]", tool, info["version"], "")
+        else:
+            table.add_row("[yellow]⚠[/yellow]", tool, "not installed", "optional")
+
+    return table
+
+
 @click.command()
 @click.option(
     "--fix",
@@ -120,61 +323,43 @@ def health(fix: bool, json_output: bool) -> None:
             "overall_status": "healthy",
         }
 
-        # Check system dependencies
-        console.print("[bold cyan]System Dependencies[/bold cyan]")
+        required_deps = REQUIRED_DEPS
 
-        required_deps = {
-            "python3": "3.11",
-            "git": "2.20",
-            "tmux": "3.0",
+        optional_tools = {
+            "ruff": None,
+            "mypy": None,
+            "pytest": None,
+            "semgrep": None,
+            "trivy": None,
+            "mutmut": None,
         }
 
+        # Probe all commands up front; results are rendered in order below
+        command_info = check_command_versions(
+            list(required_deps.items()) + list(optional_tools.items())
+        )
+
+        # Check system dependencies
         for cmd, min_ver in required_deps.items():
-            info = check_command_version(cmd, min_ver)
+            info = command_info[cmd]
             health_data["system_deps"][cmd] = info
-
-            if not json_output:
-                if info["available"]:
-                    status = "✓" if info["meets_minimum"] != False else "⚠"
-                    color = "green" if info["meets_minimum"] != False else "yellow"
-                    console.print(
-                        f"[{color}]{status}[/{color}] {cmd}: {info['version']} "
-                        f"({'OK' if info['meets_minimum'] != False else f'need >= {min_ver}'})"
-                    )
-                else:
-                    console.print(f"[red]✗[/red] {cmd}: not found (need >= {min_ver})")
-                    health_data["overall_status"] = "unhealthy"
-
-        if not json_output:
-            console.print()
+            if not info["available"]:
+                health_data["overall_status"] = "unhealthy"
 
         # Check Python packages
-        console.print("[bold cyan]Python Packages[/bold cyan]")
-
-        required_packages = [
-            "click",
-            "gitpython",
-            "libtmux",
-            "pydantic",
-            "pydantic-settings",
-            "rich",
-            "toml",
-        ]
+        required_packages = REQUIRED_PACKAGES
 
         pkg_info = check_python_packages(required_packages)
         health_data["python_packages"] = pkg_info
 
-        missing_packages = []
-        for pkg, info in pkg_info.items():
-            if not json_output:
-                if info["available"]:
-                    console.print(f"[green]✓[/green] {pkg}: {info['version']}")
-                else:
-                    console.print(f"[red]✗[/red] {pkg}: not installed")
-                    missing_packages.append(pkg)
-                    health_data["overall_status"] = "unhealthy"
+        missing_packages = [pkg for pkg, info in pkg_info.items() if not info["available"]]
+        if missing_packages:
+            health_data["overall_status"] = "unhealthy"
 
         if not json_output:
+            console.print(_system_deps_table(required_deps, command_info))
+            console.print()
+            console.print(_packages_table(pkg_info))
             console.print()
 
         # Attempt fix if requested
@@ -182,60 +367,62 @@ def health(fix: bool, json_output: bool) -> None:
             console.print("[bold yellow]Attempting to install missing packages...[/bold yellow]")
             console.print()
 
-            for pkg in missing_packages:
-                console.print(f"Installing {pkg}...")
-                try:
-                    subprocess.run(
-                        [sys.executable, "-m", "pip", "install", pkg],
-                        check=True,
-                        capture_output=True,
-                    )
+            console.print(f"Installing {', '.join(missing_packages)}...")
+            pip_cmd = [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--disable-pip-version-check",
+                "--no-input",
+                "--quiet",
+            ]
+            result = subprocess.run(
+                pip_cmd + missing_packages,
+                check=False,
+                capture_output=True,
+            )
+
+            if result.returncode == 0:
+                for pkg in missing_packages:
                     console.print(f"[green]✓ Installed {pkg}[/green]")
-                except subprocess.CalledProcessError as e:
-                    console.print(f"[red]✗ Failed to install {pkg}: {e}[/red]")
+            else:
+                # Batched install failed; retry one by one to report which package broke
+                for pkg in missing_packages:
+                    try:
+                        subprocess.run(pip_cmd + [pkg], check=True, capture_output=True)
+                        console.print(f"[green]✓ Installed {pkg}[/green]")
+                    except subprocess.CalledProcessError as e:
+                        console.print(f"[red]✗ Failed to install {pkg}: {e}[/red]")
 
             console.print()
 
         # Check optional tools
-        console.print("[bold cyan]Optional Tools[/bold cyan]")
-
-        optional_tools = {
-            "ruff": None,
-            "mypy": None,
-            "pytest": None,
-            "semgrep": None,
-            "trivy": None,
-            "mutmut": None,
-        }
-
-        optional_count = 0
         for tool in optional_tools:
-            info = check_command_version(tool)
-            health_data["optional_tools"][tool] = info
-
-            if not json_output:
-                if info["available"]:
-                    console.print(f"[green]✓[/green] {tool}: {info['version']}")
-                    optional_count += 1
-                else:
-                    console.print(f"[yellow]⚠[/yellow] {tool}: not installed (optional)")
+            health_data["optional_tools"][tool] = command_info[tool]
 
         if not json_output:
+            optional_count = sum(1 for tool in optional_tools if command_info[tool]["available"])
+            console.print(_optional_tools_table(optional_tools, command_info))
             console.print(f"\n[dim]Optional tools: {optional_count}/{len(optional_tools)} installed[/dim]")
             console.print()
 
         # Check database
-        console.print("[bold cyan]Database[/bold cyan]")
+        if not json_output:
+            console.print("[bold cyan]Database[/bold cyan]")
 
-        config_path = Path.home() / ".ai-sprint"
+        config_path = _config_dir()
         db_path = config_path / "beads.db"
 
         if db_path.exists():
             try:
-                # Try a simple query
-                with get_db(str(db_path)) as conn:
+                # Read-only probe: no journal/WAL setup and no write lock
+                conn = sqlite3.connect(f"{db_path.absolute().as_uri()}?mode=ro", uri=True)
+                try:
                     cursor = conn.execute("SELECT COUNT(*) FROM features")
                     feature_count = cursor.fetchone()[0]
+                finally:
+                    conn.close()
 
                 health_data["database"] = {
                     "accessible": True,
@@ -8,12 +8,78 @@ from pathlib import Path
 import click
 from rich.console import Console
 
-from ai_sprint.config.settings import Settings
-from ai_sprint.services.state_manager import get_db, initialize_database
+from ai_sprint.config.defaults import DEFAULT_CONFIG_TEMPLATE
 from ai_sprint.utils.logging import get_logger, setup_logging
 
 console = Console()
 
+# Subdirectories created under the config directory
+INSTALL_SUBDIRS = ("logs", "worktrees")
+
+
+def _check_dependencies() -> bool:
+    """Check required commands and Python packages in-process.
+
+    Returns:
+        True if every requirement is present and meets its minimum version
+    """
+    from ai_sprint.cli.commands.health import (
+        REQUIRED_DEPS,
+        REQUIRED_PACKAGES,
+        check_command_versions,
+        check_python_packages,
+    )
+
+    ok = True
+
+    command_info = check_command_versions(list(REQUIRED_DEPS.items()))
+    for cmd, min_ver in REQUIRED_DEPS.items():
+        info = command_info[cmd]
+        if not info["available"]:
+            console.print(f"[red]✗[/red] {cmd}: not found (need >= {min_ver})")
+            ok = False
+        elif info["meets_minimum"] is False:
+            console.print(
+                f"[yellow]⚠[/yellow] {cmd}: {info['version']} (need >= {min_ver})"
+            )
+            ok = False
+        else:
+            console.print(f"[green]✓[/green] {cmd}: {info['version']}")
+
+    missing = [
+        pkg for pkg, info in check_python_packages(REQUIRED_PACKAGES).items()
+        if not info["available"]
+    ]
+    if missing:
+        console.print(f"[red]✗[/red] Python packages missing: {', '.join(missing)}")
+        ok = False
+    else:
+        console.print(f"[green]✓[/green] Python packages: {len(REQUIRED_PACKAGES)} installed")
+
+    return ok
+
+
+def _run_install_script() -> bool:
+    """Run the bundled scripts/install.sh dependency checker.
+
+    Returns:
+        True if the script reported no problems
+    """
+    script_path = Path(__file__).parent.parent.parent.parent / "scripts" / "install.sh"
+
+    if not script_path.exists():
+        console.print(
+            "[yellow]⚠ Dependency check script not found. Skipping.[/yellow]"
+        )
+        return True
+
+    result = subprocess.run(
+        [str(script_path)],
+        capture_output=False,
+        text=True,
+    )
+    return result.returncode == 0
+
 
 @click.command()
 @click.option(
@@ -27,8 +93,15 @@ console = Console()
     is_flag=True,
     help="Force re-initialization even if already initialized",
 )
-def install(config_dir: str | None, force: bool) -> None:
+@click.option(
+    "--run-script",
+    is_flag=True,
+    help="Run scripts/install.sh for the dependency check instead of the built-in check",
+)
+def install(config_dir: str | None, force: bool, run_script: bool) -> None:
     """Initialize AI Sprint system (database, config directory)."""
+    from ai_sprint.services.state_manager import get_db, initialize_database
+
     setup_logging()
     logger = get_logger(__name__)
 
@@ -85,12 +158,14 @@ def install(config_dir: str | None, force: bool) -> None:
         console.print("[bold]Creating directory structure...[/bold]")
 
         config_path.mkdir(parents=True, exist_ok=True)
-        (config_path / "logs").mkdir(exist_ok=True)
-        (config_path / "worktrees").mkdir(exist_ok=True)
+        existing = {entry.name for entry in os.scandir(config_path)}
+        for subdir in INSTALL_SUBDIRS:
+            if subdir not in existing:
+                (config_path / subdir).mkdir()
 
         console.print(f"[green]✓ Created {config_path}[/green]")
-        console.print(f"[green]✓ Created {config_path / 'logs'}[/green]")
-        console.print(f"[green]✓ Created {config_path / 'worktrees'}[/green]")
+        for subdir in INSTALL_SUBDIRS:
+            console.print(f"[green]✓ Created {config_path / subdir}[/green]")
         console.print()
 
         # Initialize database
@@ -109,44 +184,7 @@ def install(config_dir: str | None, force: bool) -> None:
         if not config_file.exists():
             console.print("[bold]Creating example configuration...[/bold]")
 
-            example_config = """# AI Sprint Configuration
-# Edit this file to customize system behavior
-
-[general]
-database_path = "{db_path}"
-log_level = "INFO"
-log_file = "{log_file}"
-
-[agents]
-max_developers = 3
-max_testers = 3
-polling_interval_seconds = 30
-
-[timeouts]
-agent_heartbeat_seconds = 60
-agent_hung_seconds = 300
-task_max_duration_seconds = 7200
-merge_timeout_seconds = 300
-
-[quality]
-coverage_threshold = 80
-mutation_threshold = 80
-complexity_flag = 10
-complexity_max = 15
-
-[security]
-critical_cve_max = 0
-high_cve_max = 0
-medium_cve_max = 5
-
-[models]
-manager = "opus"
-cab = "haiku"
-refinery = "sonnet"
-librarian = "sonnet"
-developer = "sonnet"
-tester = "haiku"
-""".format(
+            example_config = DEFAULT_CONFIG_TEMPLATE.format(
                 db_path=str(db_path),
                 log_file=str(config_path / "logs" / "ai-sprint.log"),
             )
@@ -159,29 +197,19 @@ tester = "haiku"
         console.print("[bold]Checking system dependencies...[/bold]")
         console.print()
 
-        # Find install.sh script
-        script_path = Path(__file__).parent.parent.parent.parent / "scripts" / "install.sh"
-
-        if script_path.exists():
-            result = subprocess.run(
-                [str(script_path)],
-                capture_output=False,
-                text=True,
-            )
+        if run_script:
+            deps_ok = _run_install_script()
+        else:
+            deps_ok = _check_dependencies()
 
-            console.print()
+        console.print()
 
-            if result.returncode != 0:
-                console.print(
-                    "[yellow]⚠ Some dependencies are missing or outdated.[/yellow]"
-                )
-                console.print(
-                    "  AI Sprint may not function correctly until these are resolved."
-                )
-                console.print()
-        else:
+        if not deps_ok:
+            console.print(
+                "[yellow]⚠ Some dependencies are missing or outdated.[/yellow]"
+            )
             console.print(
-                "[yellow]⚠ Dependency check script not found. Skipping.[/yellow]"
+                "  AI Sprint may not function correctly until these are resolved."
             )
             console.print()
 
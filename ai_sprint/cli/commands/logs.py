@@ -1,13 +1,20 @@
 """Log viewing command for AI Sprint."""
 
-import subprocess
+import mmap
+import os
+import re
+import shutil
 import sys
+import time
+from collections import deque
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import click
 from rich.console import Console
 
+from ai_sprint.cli.utils import create_status_table
 from ai_sprint.utils.logging import get_logger, setup_logging
 
 console = Console()
@@ -32,61 +39,322 @@ def get_log_file(agent: str | None = None) -> Path:
         return log_dir / "ai-sprint.log"
 
 
-def filter_logs_by_time(log_path: Path, since: str | None) -> list[str]:
+def _format_size(size: int) -> str:
+    """Format a file size in bytes for the log listing."""
+    return f"{size:,} bytes" if size < 1024 else f"{size/1024:.1f} KB"
+
+
+def _copy_to_stdout(log_path: Path) -> None:
+    """Copy a file to stdout, kernel-to-kernel with sendfile where supported.
+
+    Args:
+        log_path: Path to log file
+    """
+    sys.stdout.flush()
+    out_fd = sys.stdout.fileno()
+
+    with open(log_path, "rb") as f:
+        offset = 0
+        try:
+            size = os.fstat(f.fileno()).st_size
+            while offset < size:
+                sent = os.sendfile(out_fd, f.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            # No sendfile, or not to this kind of stdout: copy through userspace
+            f.seek(offset)
+            shutil.copyfileobj(f, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+
+
+def _tail_lines(
+    log_path: Path, n: int, block_size: int = 65536, end: int | None = None
+) -> list[str]:
+    """Read the last n lines of a file by reading blocks backwards from the end.
+
+    Only about n lines' worth of bytes are read, however large the file is.
+
+    Args:
+        log_path: Path to log file
+        n: Number of lines to return
+        block_size: Bytes to read per backward step
+        end: Byte offset to treat as the end of file (default: current size)
+
+    Returns:
+        The last n lines, with line endings kept
+    """
+    with open(log_path, "rb") as f:
+        pos = os.fstat(f.fileno()).st_size if end is None else end
+        buf = b""
+        # n + 1 newlines guarantee n complete lines (the last may lack one)
+        while pos > 0 and buf.count(b"\n") <= n:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            buf = f.read(read_size) + buf
+
+    return buf.decode("utf-8", errors="replace").splitlines(keepends=True)[-n:]
+
+
+# inotify event masks (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+
+# --since suffixes and the timedelta argument each one maps to
+_SINCE_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+
+# Timestamp prefix written by the file log handler ("%(asctime)s - ...")
+_TS_RE = re.compile(rb"(\d{4})-(\d\d)-(\d\d) (\d\d):(\d\d):(\d\d),(\d{3})")
+
+# Upper bound on how long follow mode waits before re-checking for rotation
+_FOLLOW_RECHECK_SECONDS = 1.0
+
+
+def _inotify_watch(log_path: Path) -> int | None:
+    """Create an inotify descriptor watching a file for appends and rotation.
+
+    Args:
+        log_path: File to watch
+
+    Returns:
+        Readable inotify fd, or None where inotify is unavailable
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    import ctypes
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        watch_fd = libc.inotify_init1(os.O_CLOEXEC)
+        if watch_fd < 0:
+            return None
+        mask = _IN_MODIFY | _IN_DELETE_SELF | _IN_MOVE_SELF
+        if libc.inotify_add_watch(watch_fd, os.fsencode(log_path), mask) < 0:
+            os.close(watch_fd)
+            return None
+        return watch_fd
+    except (OSError, AttributeError):
+        return None
+
+
+def _follow(log_path: Path, initial_lines: int = 10) -> None:
+    """Print lines appended to a log file as they are written, like tail -f.
+
+    The last initial_lines lines are shown first, as tail -n N -f does.
+    Blocks on inotify events where available and falls back to polling
+    otherwise. Truncated files are re-read from the start and rotated files
+    (renamed or replaced) are reopened.
+
+    Args:
+        log_path: Path to log file
+        initial_lines: Number of existing lines to print before following
+    """
+    import select
+
+    fd = os.open(log_path, os.O_RDONLY)
+    end = os.fstat(fd).st_size
+    if initial_lines > 0:
+        # Stop at the offset following starts from, so no line prints twice
+        for line in _tail_lines(log_path, initial_lines, end=end):
+            console.print(line.rstrip("\n"), markup=False, highlight=False)
+    os.lseek(fd, end, os.SEEK_SET)
+    watch_fd = _inotify_watch(log_path)
+    partial = b""
+
+    try:
+        while True:
+            if watch_fd is not None:
+                ready, _, _ = select.select([watch_fd], [], [], _FOLLOW_RECHECK_SECONDS)
+                if ready:
+                    os.read(watch_fd, 4096)  # Drain; any event means "check the file"
+            else:
+                time.sleep(0.25)
+
+            # Truncated in place: start over from the beginning
+            if os.fstat(fd).st_size < os.lseek(fd, 0, os.SEEK_CUR):
+                os.lseek(fd, 0, os.SEEK_SET)
+
+            while chunk := os.read(fd, 65536):
+                *complete, partial = (partial + chunk).split(b"\n")
+                for line in complete:
+                    console.print(
+                        line.decode("utf-8", errors="replace"), markup=False, highlight=False
+                    )
+
+            # Rotated: the path now names a different file
+            try:
+                rotated = os.stat(log_path).st_ino != os.fstat(fd).st_ino
+            except FileNotFoundError:
+                rotated = False  # Wait for the new file to appear
+            if rotated:
+                os.close(fd)
+                fd = os.open(log_path, os.O_RDONLY)
+                partial = b""
+                if watch_fd is not None:
+                    os.close(watch_fd)
+                    watch_fd = _inotify_watch(log_path)
+    finally:
+        os.close(fd)
+        if watch_fd is not None:
+            os.close(watch_fd)
+
+
+def _parse_log_timestamp(line: bytes) -> tuple[int, ...] | None:
+    """Parse the "YYYY-MM-DD HH:MM:SS,fff" prefix of a raw log line.
+
+    Returns a (year, month, day, hour, minute, second, microsecond) tuple,
+    which orders the same way as the equivalent datetime, or None if the
+    line does not start with a timestamp.
+    """
+    match = _TS_RE.match(line)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, millis = map(int, match.groups())
+    return (year, month, day, hour, minute, second, millis * 1000)
+
+
+def _next_timestamped_line(data: mmap.mmap, pos: int) -> tuple[int, tuple[int, ...] | None]:
+    """Find the first line starting at or after pos that carries a timestamp.
+
+    Args:
+        data: Mapped log file
+        pos: Byte offset to start from (need not be at a line start)
+
+    Returns:
+        (offset of that line, its timestamp), or (len(data), None) if none
+    """
+    size = len(data)
+    if pos > 0 and data[pos - 1] != 0x0A:
+        newline = data.find(b"\n", pos)
+        if newline < 0:
+            return size, None
+        pos = newline + 1
+
+    while pos < size:
+        ts = _parse_log_timestamp(data[pos:pos + 23])
+        if ts is not None:
+            return pos, ts
+        newline = data.find(b"\n", pos)
+        if newline < 0:
+            break
+        pos = newline + 1
+
+    return size, None
+
+
+def _last_timestamp(data: mmap.mmap) -> tuple[int, ...] | None:
+    """Return the timestamp of the last timestamped line in the file."""
+    end = len(data)
+    while end > 0:
+        start = data.rfind(b"\n", 0, end - 1) + 1
+        ts = _parse_log_timestamp(data[start:start + 23])
+        if ts is not None:
+            return ts
+        end = start
+    return None
+
+
+def _bisect_cutoff(data: mmap.mmap, cutoff: tuple[int, ...]) -> int | None:
+    """Find the byte offset of the first entry at or after the cutoff.
+
+    Log files are append-only, so timestamps are non-decreasing; the search
+    bisects byte offsets directly and never splits the whole file into
+    lines. Lines without a timestamp (e.g. traceback continuations) belong
+    to the entry they follow.
+
+    Args:
+        data: Mapped log file
+        cutoff: Cutoff as returned by _parse_log_timestamp()
+
+    Returns:
+        Offset of the first line to keep, or None if the file does not look
+        time-ordered and the caller should scan linearly instead
+    """
+    _, first = _next_timestamped_line(data, 0)
+    last = _last_timestamp(data)
+    if first is None or last is None or first > last:
+        return None
+
+    lo, hi = 0, len(data)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        line_start, ts = _next_timestamped_line(data, mid)
+        if ts is None or ts >= cutoff:
+            hi = mid
+        else:
+            lo = line_start + 1
+
+    return _next_timestamped_line(data, lo)[0]
+
+
+def filter_logs_by_time(log_path: Path, since: str | None) -> Iterator[str]:
     """Filter log lines by time.
 
+    The duration is validated immediately; lines are read lazily, so callers
+    only hold as many lines as they keep.
+
     Args:
         log_path: Path to log file
         since: Time string (e.g., '1h', '30m', '2d')
 
     Returns:
-        List of log lines within the time window
+        Iterator over log lines within the time window
+
+    Raises:
+        ValueError: If since is not a valid duration
     """
     if not log_path.exists():
-        return []
+        return iter(())
 
-    # Parse since duration
-    cutoff_time = None
+    # Parse since duration into a tuple that compares like the parsed lines
+    cutoff_tuple = None
     if since:
         try:
             # Parse duration: 5m, 1h, 2d
             value = int(since[:-1])
-            unit = since[-1]
-
-            if unit == "m":
-                cutoff_time = datetime.now() - timedelta(minutes=value)
-            elif unit == "h":
-                cutoff_time = datetime.now() - timedelta(hours=value)
-            elif unit == "d":
-                cutoff_time = datetime.now() - timedelta(days=value)
-            else:
-                raise ValueError(f"Invalid time unit: {unit}")
+            unit = _SINCE_UNITS.get(since[-1])
+            if unit is None:
+                raise ValueError(f"Invalid time unit: {since[-1]}")
         except (ValueError, IndexError) as e:
             raise ValueError(f"Invalid --since format: {since}. Use: 5m, 1h, 2d") from e
 
-    # Read and filter lines
-    with open(log_path) as f:
-        lines = f.readlines()
+        cutoff_time = datetime.now() - timedelta(**{unit: value})
+        cutoff_tuple = (*cutoff_time.timetuple()[:6], cutoff_time.microsecond)
 
-    if not cutoff_time:
-        return lines
+    return _iter_log_lines(log_path, cutoff_tuple)
 
-    # Filter by timestamp (assumes log format has timestamp at start)
-    filtered_lines = []
-    for line in lines:
-        try:
-            # Try to parse timestamp from log line
-            # Assuming format: "2026-01-31 10:30:45,123 - ..."
-            timestamp_str = " ".join(line.split()[:2])
-            log_time = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S,%f")
 
-            if log_time >= cutoff_time:
-                filtered_lines.append(line)
-        except (ValueError, IndexError):
-            # Can't parse timestamp, include line anyway
-            filtered_lines.append(line)
+def _iter_log_lines(log_path: Path, cutoff: tuple[int, ...] | None) -> Iterator[str]:
+    """Yield decoded log lines at or after the cutoff.
+
+    The file is memory-mapped and read line by line from the cutoff offset,
+    so neither the skipped prefix nor the kept range is copied as a whole.
+
+    Args:
+        log_path: Path to log file
+        cutoff: Cutoff as returned by _parse_log_timestamp(), or None for all lines
+    """
+    with open(log_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Filter by timestamp (assumes log format has timestamp at start)
+            # Assuming format: "2026-01-31 10:30:45,123 - ..."
+            start = 0 if cutoff is None else _bisect_cutoff(data, cutoff)
+            ordered = start is not None
 
-    return filtered_lines
+            data.seek(start if ordered else 0)
+            for line in iter(data.readline, b""):
+                if not ordered:
+                    # Not time-ordered: test every line (unparseable lines are kept)
+                    log_time = _parse_log_timestamp(line)
+                    if log_time is not None and log_time < cutoff:
+                        continue
+                yield line.decode("utf-8", errors="replace")
 
 
 @click.command()
@@ -148,27 +416,27 @@ def logs(
                 console.print("  Run: ai-sprint install")
                 sys.exit(1)
 
-            log_files = sorted(log_dir.glob("*.log"))
+            log_entries = [entry for entry in os.scandir(log_dir) if entry.name.endswith(".log")]
+            log_entries.sort(key=lambda entry: entry.name)
 
-            if not log_files:
+            if not log_entries:
                 console.print("[yellow]⚠ No log files found[/yellow]")
                 console.print(f"  Directory: {log_dir}")
                 return
 
-            console.print("[bold cyan]Available Logs[/bold cyan]")
-            console.print()
+            table = create_status_table("Available Logs", ["Name", "Size", "Modified"])
+            table.columns[0].style = "cyan"
+            table.columns[1].justify = "right"
 
-            for log_file in log_files:
-                size = log_file.stat().st_size
-                size_str = f"{size:,} bytes" if size < 1024 else f"{size/1024:.1f} KB"
-
-                # Get last modified time
-                mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
-                mtime_str = mtime.strftime("%Y-%m-%d %H:%M:%S")
-
-                name = log_file.stem
-                console.print(f"  [cyan]{name:20}[/cyan] {size_str:>15}  {mtime_str}")
+            for entry in log_entries:
+                st = entry.stat()
+                table.add_row(
+                    entry.name[:-4],
+                    _format_size(st.st_size),
+                    datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
+                )
 
+            console.print(table)
             console.print()
             console.print("[dim]View log:[/dim] [cyan]ai-sprint logs <name>[/cyan]")
             return
@@ -189,23 +457,35 @@ def logs(
 
             sys.exit(1)
 
-        # Follow mode (use tail -f)
+        # Follow mode
         if follow:
             console.print(f"[dim]Following {log_path}...[/dim]")
             console.print(f"[dim]Press Ctrl+C to exit[/dim]")
             console.print()
 
             try:
-                subprocess.run(["tail", "-f", str(log_path)])
+                _follow(log_path, 10 if tail is None else tail)
             except KeyboardInterrupt:
                 console.print()
                 console.print("[dim]Stopped following log[/dim]")
                 return
 
+        # Unfiltered output to a pipe or file: copy the bytes without decoding
+        if not (since or tail or follow) and not sys.stdout.isatty():
+            title = f"[bold cyan]Agent Log:[/bold cyan] {agent}" if agent else "[bold cyan]Main Log[/bold cyan]"
+            console.print(f"{title}\n[dim]File: {log_path}[/dim]\n")
+            _copy_to_stdout(log_path)
+            logger.info(f"Displayed logs{f' for {agent}' if agent else ''}")
+            return
+
         # Read log content
         try:
             if since:
-                lines = filter_logs_by_time(log_path, since)
+                matching = filter_logs_by_time(log_path, since)
+                # With --tail, keep only a ring buffer of the last N matches
+                lines = list(deque(matching, maxlen=tail) if tail and tail > 0 else matching)
+            elif tail and tail > 0 and not follow:
+                lines = _tail_lines(log_path, tail)
             else:
                 with open(log_path) as f:
                     lines = f.readlines()
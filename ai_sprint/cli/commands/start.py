@@ -1,5 +1,7 @@
 """Start command - begin feature implementation."""
 
+import functools
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -111,9 +113,12 @@ def _validate_feature_directory(feature_dir: Path) -> None:
     """
     required_files = ["spec.md", "plan.md", "tasks.md"]
 
+    # One directory read instead of a stat per required file
+    with os.scandir(feature_dir) as entries:
+        names = {entry.name for entry in entries}
+
     for filename in required_files:
-        file_path = feature_dir / filename
-        if not file_path.exists():
+        if filename not in names:
             raise FileNotFoundError(
                 f"Required file missing: {filename}\n"
                 f"Feature directory must contain: {', '.join(required_files)}"
@@ -173,12 +178,32 @@ def _extract_feature_name(spec_file: Path) -> str:
         Feature name (first h1 heading or filename)
     """
     try:
-        content = spec_file.read_text()
-        for line in content.split("\n"):
-            if line.startswith("# "):
-                return line[2:].strip()
+        heading = _read_first_heading(str(spec_file), spec_file.stat().st_mtime_ns)
+        if heading is not None:
+            return heading
     except Exception:
         pass
 
     # Fallback to directory name
     return spec_file.parent.name
+
+
+@functools.lru_cache(maxsize=32)
+def _read_first_heading(spec_path: str, mtime_ns: int) -> Optional[str]:
+    """
+    Read a markdown file up to its first h1 heading.
+
+    Memoized on (path, mtime) so an edited spec is read again.
+
+    Args:
+        spec_path: Path to markdown file
+        mtime_ns: Modification time, used only as part of the cache key
+
+    Returns:
+        Heading text, or None if the file has no h1 heading
+    """
+    with open(spec_path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("# "):
+                return line[2:].strip()
+    return None
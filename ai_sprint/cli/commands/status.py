@@ -1,26 +1,44 @@
 """Status command - display feature implementation status."""
 
 import json
+import sqlite3
+import sys
 import time
 from typing import Any, Optional
 
 import click
-from rich.console import Console
-from rich.live import Live
-from rich.table import Table
+from rich.console import Console, Group
 
 from ai_sprint.cli.utils import error
-from ai_sprint.services.state_manager import (
-    get_db,
-    list_convoys_by_feature,
-    list_features_by_status,
-    list_tasks_by_convoy,
-)
+from ai_sprint.services.state_manager import get_db
 from ai_sprint.utils.logging import get_logger, setup_logging
 
 logger = get_logger(__name__)
 console = Console()
 
+# Task statuses reported per convoy, in display order
+TASK_STATUSES = ("todo", "in_progress", "in_review", "in_tests", "in_docs", "done")
+
+# One row per (feature, convoy, task status) with the task count
+STATUS_AGGREGATE_SQL = """
+SELECT
+    f.id AS feature_id,
+    f.name AS feature_name,
+    f.status AS feature_status,
+    c.id AS convoy_id,
+    c.story AS story,
+    c.status AS convoy_status,
+    c.assignee AS assignee,
+    t.status AS task_status,
+    COUNT(t.id) AS task_count
+FROM features f
+LEFT JOIN convoys c ON c.feature_id = f.id
+LEFT JOIN tasks t ON t.convoy_id = c.id
+WHERE {where}
+GROUP BY f.id, c.id, t.status
+ORDER BY f.created_at, f.id, c.priority, c.id
+"""
+
 
 # =============================================================================
 # T048: ai-sprint status [--json] [--watch] command
@@ -36,7 +54,7 @@ console = Console()
 @click.option(
     "--watch",
     is_flag=True,
-    help="Watch mode (refresh every 5 seconds)",
+    help="Watch mode (refresh when the database changes)",
 )
 @click.option(
     "--db-path",
@@ -91,68 +109,105 @@ def _display_status(
         feature_filter: Optional feature ID filter
         json_output: Output as JSON
     """
-    with get_db(db_path) as conn:
-        # Get all active features
-        if feature_filter:
-            features = [row for row in conn.execute(
-                "SELECT * FROM features WHERE id = ?",
-                (feature_filter,),
-            ).fetchall()]
-        else:
-            features = conn.execute(
-                "SELECT * FROM features WHERE status IN ('ready', 'in_progress') ORDER BY created_at"
-            ).fetchall()
+    with get_db(db_path, read_only=True) as conn:
+        status_data = _fetch_status_aggregate(conn, feature_filter)
 
-        if not features:
+        if not status_data:
             if json_output:
-                print(json.dumps({"features": []}))
+                _write_json({"features": []}, indent=False)
             else:
                 console.print("[yellow]No active features found[/yellow]")
             return
 
-        # Build status data
-        status_data = []
-        for feature in features:
-            feature_id = feature["id"]
-            convoys = list_convoys_by_feature(conn, feature_id)
-
-            convoy_data = []
-            for convoy in convoys:
-                convoy_id = convoy["id"]
-                tasks = list_tasks_by_convoy(conn, convoy_id)
-
-                task_counts = {
-                    "total": len(tasks),
-                    "todo": sum(1 for t in tasks if t["status"] == "todo"),
-                    "in_progress": sum(1 for t in tasks if t["status"] == "in_progress"),
-                    "in_review": sum(1 for t in tasks if t["status"] == "in_review"),
-                    "in_tests": sum(1 for t in tasks if t["status"] == "in_tests"),
-                    "in_docs": sum(1 for t in tasks if t["status"] == "in_docs"),
-                    "done": sum(1 for t in tasks if t["status"] == "done"),
-                }
-
-                convoy_data.append({
-                    "id": convoy_id,
-                    "story": convoy["story"],
-                    "status": convoy["status"],
-                    "assignee": convoy["assignee"],
-                    "tasks": task_counts,
-                })
-
-            status_data.append({
-                "id": feature_id,
-                "name": feature["name"],
-                "status": feature["status"],
-                "convoys": convoy_data,
-            })
-
         # Output
         if json_output:
-            print(json.dumps({"features": status_data}, indent=2))
+            _write_json({"features": status_data})
         else:
             _render_status_table(status_data)
 
 
+def _fetch_status_aggregate(
+    conn: sqlite3.Connection,
+    feature_filter: Optional[str],
+) -> list[dict[str, Any]]:
+    """
+    Fetch features, their convoys and per-status task counts in one query.
+
+    Args:
+        conn: Database connection
+        feature_filter: Optional feature ID filter (otherwise active features)
+
+    Returns:
+        Status data structure: features with nested convoys and task counts
+    """
+    if feature_filter:
+        rows = conn.execute(
+            STATUS_AGGREGATE_SQL.format(where="f.id = ?"),
+            (feature_filter,),
+        )
+    else:
+        rows = conn.execute(
+            STATUS_AGGREGATE_SQL.format(where="f.status IN ('ready', 'in_progress')")
+        )
+
+    features: dict[str, dict[str, Any]] = {}
+    convoys: dict[str, dict[str, Any]] = {}
+
+    for row in rows:
+        feature = features.get(row["feature_id"])
+        if feature is None:
+            feature = features[row["feature_id"]] = {
+                "id": row["feature_id"],
+                "name": row["feature_name"],
+                "status": row["feature_status"],
+                "convoys": [],
+            }
+
+        convoy_id = row["convoy_id"]
+        if convoy_id is None:
+            continue
+
+        convoy = convoys.get(convoy_id)
+        if convoy is None:
+            convoy = convoys[convoy_id] = {
+                "id": convoy_id,
+                "story": row["story"],
+                "status": row["convoy_status"],
+                "assignee": row["assignee"],
+                "tasks": {"total": 0, **dict.fromkeys(TASK_STATUSES, 0)},
+            }
+            feature["convoys"].append(convoy)
+
+        if row["task_status"] is not None:
+            convoy["tasks"][row["task_status"]] = row["task_count"]
+            convoy["tasks"]["total"] += row["task_count"]
+
+    return list(features.values())
+
+
+def _write_json(data: dict[str, Any], indent: bool = True) -> None:
+    """
+    Write JSON to stdout, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with two-space indentation
+    """
+    try:
+        import orjson
+    except ImportError:
+        print(json.dumps(data, indent=2 if indent else None))
+        return
+
+    option = orjson.OPT_APPEND_NEWLINE
+    if indent:
+        option |= orjson.OPT_INDENT_2
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=option))
+    sys.stdout.buffer.flush()
+
+
 def _render_status_table(status_data: list[dict[str, Any]]) -> None:
     """
     Render status as Rich table.
@@ -160,40 +215,47 @@ def _render_status_table(status_data: list[dict[str, Any]]) -> None:
     Args:
         status_data: Status data structure
     """
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     for feature_status in status_data:
-        # Feature header
-        console.print(f"\n[bold cyan]Feature:[/bold cyan] {feature_status['name']}")
-        console.print(f"[dim]ID:[/dim] {feature_status['id']}")
-        console.print(f"[dim]Status:[/dim] {feature_status['status']}")
+        header = Text.from_markup(
+            f"[dim]ID:[/dim] {feature_status['id']}\n"
+            f"[dim]Status:[/dim] {feature_status['status']}"
+        )
 
         if not feature_status["convoys"]:
-            console.print("[yellow]  No convoys created yet[/yellow]")
-            continue
-
-        # Convoys table
-        table = Table(title="Convoys")
-        table.add_column("Convoy", style="cyan")
-        table.add_column("Story")
-        table.add_column("Status", style="magenta")
-        table.add_column("Assignee", style="green")
-        table.add_column("Tasks", justify="right")
-
-        for convoy in feature_status["convoys"]:
-            tasks = convoy["tasks"]
-            task_summary = (
-                f"{tasks['done']}/{tasks['total']} done "
-                f"({tasks['in_progress']} in progress)"
-            )
-
-            table.add_row(
-                convoy["id"],
-                convoy["story"],
-                convoy["status"],
-                convoy["assignee"] or "-",
-                task_summary,
+            body = Group(header, Text.from_markup("[yellow]No convoys created yet[/yellow]"))
+        else:
+            # Convoys table
+            table = Table(title="Convoys")
+            table.add_column("Convoy", style="cyan")
+            table.add_column("Story")
+            table.add_column("Status", style="magenta")
+            table.add_column("Assignee", style="green")
+            table.add_column("Tasks", justify="right")
+
+            for convoy in feature_status["convoys"]:
+                tasks = convoy["tasks"]
+                table.add_row(
+                    convoy["id"],
+                    convoy["story"],
+                    convoy["status"],
+                    convoy["assignee"] or "-",
+                    f"{tasks['done']}/{tasks['total']} done ({tasks['in_progress']} in progress)",
+                )
+
+            body = Group(header, table)
+
+        console.print(
+            Panel(
+                body,
+                title=f"[bold cyan]Feature:[/bold cyan] {feature_status['name']}",
+                title_align="left",
+                expand=False,
             )
-
-        console.print(table)
+        )
 
 
 def _watch_status(
@@ -201,57 +263,53 @@ def _watch_status(
     feature_filter: Optional[str],
 ) -> None:
     """
-    Watch mode - refresh status every 5 seconds.
+    Watch mode - refresh status whenever the database changes.
+
+    Polls `PRAGMA data_version` every second, which only changes when
+    another connection commits, and re-queries and re-renders only then.
 
     Args:
         db_path: Path to database
         feature_filter: Optional feature ID filter
     """
-    with Live(console=console, refresh_per_second=0.2) as live:
+    from rich.live import Live
+    from rich.table import Table
+
+    # One connection for the whole watch; reads see new commits on each query
+    with get_db(db_path, read_only=True) as conn, Live(console=console, refresh_per_second=0.2) as live:
+        last_version = None
+
         while True:
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version == last_version:
+                time.sleep(1)
+                continue
+            last_version = data_version
+
             # Create renderable for current status
-            with get_db(db_path) as conn:
-                if feature_filter:
-                    features = [row for row in conn.execute(
-                        "SELECT * FROM features WHERE id = ?",
-                        (feature_filter,),
-                    ).fetchall()]
-                else:
-                    features = conn.execute(
-                        "SELECT * FROM features WHERE status IN ('ready', 'in_progress') ORDER BY created_at"
-                    ).fetchall()
-
-                if not features:
-                    live.update("[yellow]No active features found[/yellow]")
-                    time.sleep(5)
-                    continue
-
-                # Build tables for all features
-                renderables = []
-                for feature in features:
-                    feature_id = feature["id"]
-                    convoys = list_convoys_by_feature(conn, feature_id)
-
-                    table = Table(title=f"{feature['name']} ({feature_id})")
-                    table.add_column("Convoy", style="cyan")
-                    table.add_column("Status", style="magenta")
-                    table.add_column("Tasks Done", justify="right")
-
-                    for convoy in convoys:
-                        tasks = list_tasks_by_convoy(conn, convoy["id"])
-                        done_count = sum(1 for t in tasks if t["status"] == "done")
-                        total_count = len(tasks)
-
-                        table.add_row(
-                            convoy["story"],
-                            convoy["status"],
-                            f"{done_count}/{total_count}",
-                        )
-
-                    renderables.append(table)
-
-                # Update live display
-                if renderables:
-                    live.update(renderables[0] if len(renderables) == 1 else renderables[0])
-
-            time.sleep(5)
+            status_data = _fetch_status_aggregate(conn, feature_filter)
+
+            if not status_data:
+                live.update("[yellow]No active features found[/yellow]", refresh=True)
+                continue
+
+            # Build tables for all features
+            renderables = []
+            for feature in status_data:
+                table = Table(title=f"{feature['name']} ({feature['id']})")
+                table.add_column("Convoy", style="cyan")
+                table.add_column("Status", style="magenta")
+                table.add_column("Tasks Done", justify="right")
+
+                for convoy in feature["convoys"]:
+                    tasks = convoy["tasks"]
+                    table.add_row(
+                        convoy["story"],
+                        convoy["status"],
+                        f"{tasks['done']}/{tasks['total']}",
+                    )
+
+                renderables.append(table)
+
+            # Update live display with every feature in one render
+            live.update(Group(*renderables), refresh=True)
@@ -1,13 +1,26 @@
 """Stop command - halt feature implementation."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import click
 
 from ai_sprint.cli.utils import error, info, success
-from ai_sprint.services.session_manager import SessionManager
+from ai_sprint.services.session_manager import SPARE_SESSION_PREFIX, SessionManager
 from ai_sprint.utils.logging import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
+# Session name prefixes used by AI Sprint agents
+AI_SPRINT_SESSION_PREFIXES = (
+    "manager",
+    "dev-",
+    "test-",
+    "cab",
+    "refinery",
+    "librarian",
+    SPARE_SESSION_PREFIX,
+)
+
 
 # =============================================================================
 # T047: ai-sprint stop [--force] command
@@ -35,10 +48,7 @@ def stop(force: bool) -> None:
         sessions = session_manager.list_sessions()
 
         # Filter AI Sprint sessions (manager, dev-*, test-*, etc.)
-        ai_sprint_sessions = [
-            s for s in sessions
-            if s.startswith(("manager", "dev-", "test-", "cab", "refinery", "librarian"))
-        ]
+        ai_sprint_sessions = [s for s in sessions if s.startswith(AI_SPRINT_SESSION_PREFIXES)]
 
         if not ai_sprint_sessions:
             info("No active AI Sprint sessions found")
@@ -53,15 +63,22 @@ def stop(force: bool) -> None:
                 info("Stop cancelled")
                 return
 
-        # Stop all sessions
+        # Stop all sessions concurrently; each kill is a separate tmux call
         stopped_count = 0
-        for session_name in ai_sprint_sessions:
-            try:
-                session_manager.destroy_session(session_name)
-                logger.info(f"Stopped session: {session_name}")
-                stopped_count += 1
-            except Exception as e:
-                error(f"Failed to stop {session_name}: {e}")
+        with ThreadPoolExecutor(max_workers=min(16, len(ai_sprint_sessions))) as executor:
+            futures = {
+                executor.submit(session_manager.destroy_session, session_name): session_name
+                for session_name in ai_sprint_sessions
+            }
+            for future in as_completed(futures):
+                session_name = futures[future]
+                try:
+                    future.result()
+                    logger.info(f"Stopped session: {session_name}")
+                    stopped_count += 1
+                except Exception as e:
+                    logger.error(f"Failed to stop {session_name}: {e}")
+                    info(f"[red]✗[/red] Failed to stop {session_name}: {e}")
 
         success(f"Stopped {stopped_count}/{len(ai_sprint_sessions)} sessions")
 
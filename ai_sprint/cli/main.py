@@ -1,5 +1,6 @@
 """Main CLI entry point for AI Sprint."""
 
+import importlib
 import warnings
 
 import click
@@ -8,16 +9,35 @@ import click
 warnings.filterwarnings("ignore", category=UserWarning, module="pydantic_settings")
 
 from ai_sprint import __version__
-from ai_sprint.cli.commands.config import config
-from ai_sprint.cli.commands.health import health
-from ai_sprint.cli.commands.install import install
-from ai_sprint.cli.commands.logs import logs
-from ai_sprint.cli.commands.start import start
-from ai_sprint.cli.commands.status import status
-from ai_sprint.cli.commands.stop import stop
 
+# Subcommand name -> module under ai_sprint.cli.commands defining it
+COMMANDS = ("install", "health", "config", "start", "stop", "status", "logs")
 
-@click.group()
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is used.
+
+    Each command module pulls in its own heavy dependencies (rich, pydantic,
+    GitPython, libtmux), so deferring the import keeps startup proportional
+    to the one command actually run.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(COMMANDS) | set(self.commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        if cmd_name not in COMMANDS:
+            return None
+
+        module = importlib.import_module(f"ai_sprint.cli.commands.{cmd_name}")
+        command = getattr(module, cmd_name)
+        self.add_command(command, cmd_name)
+        return command
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__, prog_name="ai-sprint")
 @click.pass_context
 def cli(ctx: click.Context) -> None:
@@ -31,15 +51,5 @@ def cli(ctx: click.Context) -> None:
     ctx.ensure_object(dict)
 
 
-# Register commands
-cli.add_command(install)
-cli.add_command(health)
-cli.add_command(config)
-cli.add_command(start)
-cli.add_command(stop)
-cli.add_command(status)
-cli.add_command(logs)
-
-
 if __name__ == "__main__":
     cli()
@@ -1,5 +1,6 @@
 """CLI utility functions."""
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -57,15 +58,18 @@ def validate_feature_dir(feature_dir: str) -> Path:
     """
     path = Path(feature_dir)
 
-    if not path.exists():
+    # A single directory read answers existence, type and contents
+    try:
+        with os.scandir(path) as entries:
+            names = {entry.name for entry in entries}
+    except FileNotFoundError:
         error(f"Feature directory not found: {feature_dir}")
-
-    if not path.is_dir():
+    except NotADirectoryError:
         error(f"Not a directory: {feature_dir}")
 
     # Check for required files
     required_files = ["spec.md", "plan.md", "tasks.md"]
-    missing = [f for f in required_files if not (path / f).exists()]
+    missing = [f for f in required_files if f not in names]
 
     if missing:
         error(f"Missing required files in {feature_dir}: {', '.join(missing)}")
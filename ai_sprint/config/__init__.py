@@ -1,5 +1,18 @@
 """Configuration management for AI Sprint."""
 
-from ai_sprint.config.settings import Settings
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["Settings"]
+if TYPE_CHECKING:
+    from ai_sprint.config.settings import Settings, get_default_settings
+
+__all__ = ["Settings", "get_default_settings"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve Settings on first use so importing ai_sprint.config.defaults
+    # does not pull in pydantic.
+    if name in ("Settings", "get_default_settings"):
+        from ai_sprint.config import settings
+
+        return getattr(settings, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
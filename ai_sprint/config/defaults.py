@@ -35,3 +35,50 @@ MODEL_TESTER = "haiku"  # high-frequency, low-complexity
 DATABASE_PATH_DEFAULT = "~/.ai-sprint/beads.db"
 LOG_FILE_DEFAULT = "~/.ai-sprint/logs/ai-sprint.log"
 LOG_LEVEL_DEFAULT = "INFO"
+
+# Configuration file written by `ai-sprint install` and `ai-sprint config reset`.
+# `{db_path}` and `{log_file}` are filled in by the caller.
+DEFAULT_CONFIG_TEMPLATE = """# AI Sprint Configuration
+# Edit this file to customize system behavior
+
+[general]
+database_path = "{db_path}"
+log_level = "INFO"
+log_file = "{log_file}"
+
+[agents]
+max_developers = 3
+max_testers = 3
+polling_interval_seconds = 30
+
+[timeouts]
+agent_heartbeat_seconds = 60
+agent_hung_seconds = 300
+task_max_duration_seconds = 7200
+merge_timeout_seconds = 300
+
+[quality]
+coverage_threshold = 80
+mutation_threshold = 80
+complexity_flag = 10
+complexity_max = 15
+
+[security]
+critical_cve_max = 0
+high_cve_max = 0
+medium_cve_max = 5
+
+[models]
+manager = "opus"
+cab = "haiku"
+refinery = "sonnet"
+librarian = "sonnet"
+developer = "sonnet"
+tester = "haiku"
+"""
+
+DEFAULT_CONFIG_TOML = DEFAULT_CONFIG_TEMPLATE.format(
+    db_path=DATABASE_PATH_DEFAULT,
+    log_file=LOG_FILE_DEFAULT,
+)
+DEFAULT_CONFIG_BYTES = DEFAULT_CONFIG_TOML.encode("utf-8")
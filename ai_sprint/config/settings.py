@@ -1,5 +1,8 @@
 """Configuration settings using Pydantic."""
 
+import functools
+import os
+import tomllib
 from pathlib import Path
 from typing import Literal
 
@@ -81,14 +84,72 @@ class Settings(BaseSettings):
         """
         Load settings from TOML file or environment variables.
 
+        The result is cached per config_path, so agents constructed in the
+        same process share one instance instead of re-validating.
+
         Args:
             config_path: Optional path to TOML config file
 
         Returns:
             Settings instance with loaded configuration
         """
-        if config_path:
-            path = Path(config_path).expanduser()
-            if path.exists():
-                return cls(_env_file=str(path))  # type: ignore
-        return cls()
+        return _load_settings(config_path)
+
+    @classmethod
+    def defaults(cls) -> "Settings":
+        """
+        Build default settings without running validators.
+
+        The defaults are known to satisfy every field constraint, so the
+        nested models are assembled with model_construct().
+
+        Returns:
+            Settings instance with default configuration
+        """
+        return cls.model_construct(
+            general=GeneralSettings.model_construct(),
+            agents=AgentSettings.model_construct(),
+            timeouts=TimeoutSettings.model_construct(),
+            quality=QualitySettings.model_construct(),
+            security=SecuritySettings.model_construct(),
+            models=ModelSettings.model_construct(),
+        )
+
+
+def _has_env_overrides() -> bool:
+    """Check whether any AI_SPRINT_* environment variable is set."""
+    prefix = Settings.model_config["env_prefix"]
+    return any(key.upper().startswith(prefix) for key in os.environ)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_settings(config_path: str | None) -> Settings:
+    """Load and validate settings once per config path."""
+    env_overrides = _has_env_overrides()
+    if config_path:
+        path = Path(config_path).expanduser()
+        try:
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        except FileNotFoundError:
+            pass
+        else:
+            if not env_overrides:
+                return Settings.model_validate(data)
+            # File values win over the environment for keys set in both
+            return Settings(**data)
+    if not env_overrides:
+        return Settings.defaults()
+    return Settings()
+
+
+def get_default_settings() -> Settings:
+    """
+    Get the process-wide default settings instance.
+
+    Agents constructed without explicit settings share this one object.
+
+    Returns:
+        Settings loaded from the environment (or pure defaults)
+    """
+    return _load_settings(None)
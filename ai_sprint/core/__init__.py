@@ -1,11 +1,25 @@
 """Core agent implementations for AI Sprint."""
 
-from ai_sprint.core.cab import CABAgent
-from ai_sprint.core.developer import DeveloperAgent
-from ai_sprint.core.librarian import LibrarianAgent
-from ai_sprint.core.manager import ManagerAgent
-from ai_sprint.core.refinery import RefineryAgent
-from ai_sprint.core.tester import TesterAgent
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ai_sprint.core.cab import CABAgent
+    from ai_sprint.core.developer import DeveloperAgent
+    from ai_sprint.core.librarian import LibrarianAgent
+    from ai_sprint.core.manager import ManagerAgent
+    from ai_sprint.core.refinery import RefineryAgent
+    from ai_sprint.core.tester import TesterAgent
+
+# Agent classes resolved on first use, so importing one agent module does
+# not import every other agent (and its git/tmux/quality-gate dependencies)
+_LAZY_EXPORTS = {
+    "CABAgent": "ai_sprint.core.cab",
+    "DeveloperAgent": "ai_sprint.core.developer",
+    "LibrarianAgent": "ai_sprint.core.librarian",
+    "ManagerAgent": "ai_sprint.core.manager",
+    "RefineryAgent": "ai_sprint.core.refinery",
+    "TesterAgent": "ai_sprint.core.tester",
+}
 
 __all__ = [
     "CABAgent",
@@ -15,3 +29,13 @@ __all__ = [
     "RefineryAgent",
     "TesterAgent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    return getattr(importlib.import_module(module_name), name)
@@ -1,14 +1,15 @@
 """CAB agent - code review router."""
 
-import sqlite3
+import subprocess
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
-from ai_sprint.config.settings import Settings
-from ai_sprint.services.quality_gates import QualityGateRunner
+from ai_sprint.config.settings import Settings, get_default_settings
+from ai_sprint.services.quality_gates import GateResult, QualityGateRunner
 from ai_sprint.services.state_manager import (
-    get_db,
     get_task,
+    pooled_db,
     publish_event,
     update_task_status,
 )
@@ -31,6 +32,17 @@ class CABAgent:
     - Provide specific rejection feedback
     """
 
+    __slots__ = (
+        "db_path",
+        "working_dir",
+        "settings",
+        "_runner",
+        "_review_cache",
+    )
+
+    # Review results kept per clean git tree, so unchanged code is not re-linted
+    REVIEW_CACHE_SIZE = 32
+
     def __init__(
         self,
         db_path: str = "~/.ai-sprint/beads.db",
@@ -45,9 +57,54 @@ class CABAgent:
             working_dir: Directory containing code to review
             settings: Application settings
         """
-        self.db_path = db_path
+        self.db_path = Path(db_path).expanduser()
         self.working_dir = working_dir or Path.cwd()
-        self.settings = settings or Settings()
+        self.settings = settings or get_default_settings()
+        self._runner = QualityGateRunner(self.settings, self.working_dir)
+        self._review_cache: OrderedDict[str, list[GateResult]] = OrderedDict()
+
+    def _tree_hash(self) -> Optional[str]:
+        """
+        Get the git tree hash of a clean working directory.
+
+        Returns:
+            Tree hash of HEAD, or None if not a git repo or there are
+            uncommitted changes (the tree would not describe the code)
+        """
+        try:
+            dirty = subprocess.run(
+                ["git", "status", "--porcelain"],
+                cwd=self.working_dir,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            if dirty:
+                return None
+            return subprocess.run(
+                ["git", "rev-parse", "HEAD^{tree}"],
+                cwd=self.working_dir,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def _run_review_gates(self) -> None:
+        """Run review-stage gates, reusing results for an unchanged tree."""
+        tree = self._tree_hash()
+        if tree is not None and tree in self._review_cache:
+            logger.info("Reusing quality gate results for tree %s", tree[:12])
+            self._review_cache.move_to_end(tree)
+            self._runner.results = list(self._review_cache[tree])
+            return
+
+        results = self._runner.run_all_gates(stage="review")
+        if tree is not None:
+            self._review_cache[tree] = list(results)
+            if len(self._review_cache) > self.REVIEW_CACHE_SIZE:
+                self._review_cache.popitem(last=False)
 
     def review_task(self, task_id: str) -> bool:
         """
@@ -61,24 +118,24 @@ class CABAgent:
         Returns:
             True if approved, False if rejected
         """
-        logger.info(f"Reviewing task: {task_id}")
+        logger.info("Reviewing task: %s", task_id)
 
-        with get_db(self.db_path) as conn:
+        with pooled_db(self.db_path) as conn:
             task = get_task(conn, task_id)
             if not task:
-                logger.error(f"Task not found: {task_id}")
+                logger.error("Task not found: %s", task_id)
                 return False
 
             if task["status"] != "in_review":
-                logger.error(f"Task {task_id} not in review status")
+                logger.error("Task %s not in review status", task_id)
                 return False
 
             # Run quality gates for review stage
-            runner = QualityGateRunner(self.settings, self.working_dir)
-            results = runner.run_all_gates(stage="review")
+            runner = self._runner
+            self._run_review_gates()
 
             if runner.all_gates_passed():
-                logger.info(f"Task {task_id} passed all quality gates")
+                logger.info("Task %s passed all quality gates", task_id)
 
                 # Approve - route to testing
                 update_task_status(conn, task_id, "in_tests")
@@ -95,7 +152,7 @@ class CABAgent:
             else:
                 # Failed quality gates - reject with specific feedback
                 failure_message = runner.get_failure_message()
-                logger.warning(f"Task {task_id} failed quality gates: {failure_message}")
+                logger.warning("Task %s failed quality gates: %s", task_id, failure_message)
 
                 self.reject_task(task_id, failure_message)
                 return False
@@ -112,9 +169,9 @@ class CABAgent:
             task_id: Task to reject
             reason: Specific rejection reason
         """
-        logger.info(f"Rejecting task {task_id}: {reason}")
+        logger.info("Rejecting task %s: %s", task_id, reason)
 
-        with get_db(self.db_path) as conn:
+        with pooled_db(self.db_path) as conn:
             # Update status back to in_progress
             update_task_status(conn, task_id, "in_progress")
 
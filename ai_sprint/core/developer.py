@@ -1,15 +1,16 @@
 """Developer agent - task implementation."""
 
-import sqlite3
 from pathlib import Path
 from typing import Optional
 
 from ai_sprint.services.state_manager import (
-    claim_task_atomic,
+    ACTIVE_TASK_STATUSES,
+    acknowledge_events,
+    claim_next_task_atomic,
     consume_events,
-    get_db,
     get_task,
-    list_tasks_by_convoy,
+    load_payload,
+    pooled_db,
     publish_event,
     update_task_status,
 )
@@ -34,6 +35,23 @@ class DeveloperAgent:
     - Handle rework requests
     """
 
+    __slots__ = (
+        "agent_id",
+        "db_path",
+        "worktree_path",
+        "current_task_id",
+    )
+
+    # Kept as a constant so the connection's statement cache reuses the plan
+    RECOVER_STATE_SQL = f"""
+        SELECT id, status, title
+        FROM tasks
+        WHERE assignee = ?
+        AND status IN ({", ".join("?" * len(ACTIVE_TASK_STATUSES))})
+        ORDER BY started_at DESC
+        LIMIT 1
+    """
+
     def __init__(
         self,
         agent_id: str,
@@ -49,7 +67,7 @@ class DeveloperAgent:
             worktree_path: Path to git worktree for this agent
         """
         self.agent_id = agent_id
-        self.db_path = db_path
+        self.db_path = Path(db_path).expanduser()
         self.worktree_path = worktree_path
         self.current_task_id: Optional[str] = None
 
@@ -63,16 +81,12 @@ class DeveloperAgent:
         Returns:
             Task ID if claimed, None otherwise
         """
-        with get_db(self.db_path) as conn:
-            tasks = list_tasks_by_convoy(conn, convoy_id, status="todo")
+        with pooled_db(self.db_path) as conn:
+            task_id = claim_next_task_atomic(conn, convoy_id, self.agent_id)
 
-            for task in tasks:
-                task_id = task["id"]
-                if claim_task_atomic(conn, task_id, self.agent_id):
-                    logger.info(f"Claimed task: {task_id}")
-                    return task_id
-
-            return None
+        if task_id:
+            logger.info("Claimed task: %s", task_id)
+        return task_id
 
     def implement_task(self, task_id: str) -> bool:
         """
@@ -84,12 +98,12 @@ class DeveloperAgent:
         Returns:
             True if implementation succeeded
         """
-        logger.info(f"Implementing task: {task_id}")
+        logger.info("Implementing task: %s", task_id)
 
-        with get_db(self.db_path) as conn:
+        with pooled_db(self.db_path) as conn:
             task = get_task(conn, task_id)
             if not task:
-                logger.error(f"Task not found: {task_id}")
+                logger.error("Task not found: %s", task_id)
                 return False
 
             # TODO: Invoke Claude Code for implementation
@@ -113,15 +127,23 @@ class DeveloperAgent:
             return True
 
     def process_rework_events(self) -> None:
-        """Process REWORK_NEEDED events."""
-        with get_db(self.db_path) as conn:
+        """
+        Process REWORK_NEEDED events.
+
+        The consumed batch is acknowledged in one transaction once every
+        event has been handled, rather than one commit per event.
+        """
+        with pooled_db(self.db_path) as conn:
             events = consume_events(conn, self.agent_id, limit=10)
 
+            handled: list[str] = []
             for event in events:
                 if event["event_type"] == "REWORK_NEEDED":
-                    task_id = event["payload"]["task_id"]
-                    reason = event["payload"]["reason"]
-                    self.rework_task(task_id, reason)
+                    payload = load_payload(event["payload"])
+                    self.rework_task(payload["task_id"], payload["reason"])
+                handled.append(event["id"])
+
+            acknowledge_events(conn, handled)
 
     def rework_task(self, task_id: str, reason: str) -> None:
         """
@@ -131,7 +153,7 @@ class DeveloperAgent:
             task_id: Task to rework
             reason: Rejection reason
         """
-        logger.info(f"Reworking task {task_id}: {reason}")
+        logger.info("Reworking task %s: %s", task_id, reason)
         # TODO: Apply fixes based on rejection reason
         logger.warning("Task rework not implemented")
 
@@ -144,18 +166,11 @@ class DeveloperAgent:
         Returns:
             Task ID if resuming work, None if starting fresh
         """
-        with get_db(self.db_path) as conn:
+        with pooled_db(self.db_path) as conn:
             # Check for in-progress task assigned to this agent
             cursor = conn.execute(
-                """
-                SELECT id, status, title
-                FROM tasks
-                WHERE assignee = ?
-                AND status IN ('in_progress', 'in_review', 'in_tests', 'in_docs')
-                ORDER BY started_at DESC
-                LIMIT 1
-                """,
-                (self.agent_id,),
+                self.RECOVER_STATE_SQL,
+                (self.agent_id, *ACTIVE_TASK_STATUSES),
             )
             row = cursor.fetchone()
 
@@ -164,7 +179,10 @@ class DeveloperAgent:
                 status = row[1]
                 title = row[2]
                 logger.info(
-                    f"Recovered state: resuming task {task_id} ({title}) in state {status}"
+                    "Recovered state: resuming task %s (%s) in state %s",
+                    task_id,
+                    title,
+                    status,
                 )
                 self.current_task_id = task_id
                 return task_id
@@ -182,14 +200,14 @@ class DeveloperAgent:
         Returns:
             True if resumed successfully
         """
-        with get_db(self.db_path) as conn:
+        with pooled_db(self.db_path) as conn:
             task = get_task(conn, task_id)
             if not task:
-                logger.error(f"Cannot resume - task not found: {task_id}")
+                logger.error("Cannot resume - task not found: %s", task_id)
                 return False
 
             status = task["status"]
-            logger.info(f"Resuming task {task_id} in state {status}")
+            logger.info("Resuming task %s in state %s", task_id, status)
 
             # Resume based on current status
             if status == "in_progress":
@@ -197,16 +215,16 @@ class DeveloperAgent:
                 return self.implement_task(task_id)
             elif status == "in_review":
                 # Wait for CAB review
-                logger.info(f"Task {task_id} already in review - waiting")
+                logger.info("Task %s already in review - waiting", task_id)
                 return True
             elif status == "in_tests":
                 # Wait for testing
-                logger.info(f"Task {task_id} already in tests - waiting")
+                logger.info("Task %s already in tests - waiting", task_id)
                 return True
             elif status == "in_docs":
                 # Wait for merge
-                logger.info(f"Task {task_id} already in docs - waiting")
+                logger.info("Task %s already in docs - waiting", task_id)
                 return True
             else:
-                logger.warning(f"Unexpected task status {status} for {task_id}")
+                logger.warning("Unexpected task status %s for %s", status, task_id)
                 return False
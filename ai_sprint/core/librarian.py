@@ -1,6 +1,5 @@
 """Librarian agent - documentation generation."""
 
-import sqlite3
 from pathlib import Path
 from typing import Optional
 
@@ -8,6 +7,7 @@ from ai_sprint.services.state_manager import (
     consume_events,
     get_convoy,
     get_db,
+    load_payload,
 )
 from ai_sprint.utils.logging import get_logger
 
@@ -29,6 +29,11 @@ class LibrarianAgent:
     - Create user guides
     """
 
+    __slots__ = (
+        "db_path",
+        "agent_id",
+    )
+
     def __init__(self, db_path: str = "~/.ai-sprint/beads.db"):
         """
         Initialize Librarian agent.
@@ -46,7 +51,7 @@ class LibrarianAgent:
 
             for event in events:
                 if event["event_type"] == "UPDATE_DOCS":
-                    convoy_id = event["payload"]["convoy_id"]
+                    convoy_id = load_payload(event["payload"])["convoy_id"]
                     self.update_documentation(convoy_id)
 
     def update_documentation(self, convoy_id: str) -> None:
@@ -56,12 +61,12 @@ class LibrarianAgent:
         Args:
             convoy_id: Convoy that was merged
         """
-        logger.info(f"Updating documentation for convoy: {convoy_id}")
+        logger.info("Updating documentation for convoy: %s", convoy_id)
 
         with get_db(self.db_path) as conn:
             convoy = get_convoy(conn, convoy_id)
             if not convoy:
-                logger.error(f"Convoy not found: {convoy_id}")
+                logger.error("Convoy not found: %s", convoy_id)
                 return
 
             # TODO: Generate documentation
@@ -74,7 +79,7 @@ class LibrarianAgent:
         Args:
             source_dir: Directory containing source code
         """
-        logger.info(f"Generating API docs for: {source_dir}")
+        logger.info("Generating API docs for: %s", source_dir)
         # TODO: Use tool like sphinx or mkdocs
         logger.warning("API doc generation not implemented")
 
@@ -1,26 +1,102 @@
 """Manager agent - orchestrates feature implementation."""
 
+import functools
+import re
 import sqlite3
-import time
+import threading
+from collections import defaultdict, namedtuple
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from ai_sprint.config.settings import Settings
+from ai_sprint.config.settings import Settings, get_default_settings
 from ai_sprint.services.health_monitor import HealthMonitor
 from ai_sprint.services.state_manager import (
+    ACTIVE_TASK_STATUSES,
     create_convoy,
-    get_db,
-    increment_task_failure_count,
+    create_task,
     list_convoys_by_feature,
-    list_features_by_status,
-    publish_event,
+    pooled_db,
+    publish_events,
     update_feature_status,
 )
-from ai_sprint.services.session_manager import SessionManager, spawn_agent
+from ai_sprint.services.session_manager import (
+    SessionManager,
+    agent_session_name,
+    spawn_agent,
+)
 from ai_sprint.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# One pass over tasks.md: "## ..." headings (which may carry the story
+# priority) and open task lines such as "- [ ] T012 [P] [US1] Do X in a/b.py"
+TASKS_MD_RE = re.compile(
+    r"^(?:## .*?(?:\(Priority: (?P<priority>P\d)\).*)?"
+    r"|- \[ \] (?P<task_id>T\d+)(?: \[P\])?(?: \[(?P<story>US\d+)\])? (?P<description>.+?))\s*$",
+    re.MULTILINE,
+)
+TASK_FILE_RE = re.compile(r"\bin `?(?P<path>[\w./-]+\.\w+)`?")
+
+# Columns the manager needs from a ready feature, read as a plain tuple
+FeatureRow = namedtuple("FeatureRow", ["id", "spec_path"])
+
+# Convoy story for open tasks that are not tagged with a user story
+UNTAGGED_STORY = "setup"
+
+
+@dataclass(frozen=True)
+class ParsedTask:
+    """Open task line parsed from tasks.md."""
+
+    task_id: str
+    story: str
+    priority: str
+    description: str
+    file_path: str
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_tasks_file(tasks_path: str, mtime_ns: int) -> tuple[ParsedTask, ...]:
+    """
+    Parse the open (unchecked) tasks from a tasks.md file.
+
+    Memoized on (path, mtime) so re-polling an unchanged file is a stat.
+
+    Args:
+        tasks_path: Path to tasks.md
+        mtime_ns: Modification time, used only as part of the cache key
+
+    Returns:
+        Parsed tasks in file order
+    """
+    with open(tasks_path, encoding="utf-8") as f:
+        text = f.read()
+
+    tasks = []
+    priority = "P1"
+    for match in TASKS_MD_RE.finditer(text):
+        if match["task_id"] is None:
+            # Section heading - later tasks inherit its priority
+            priority = match["priority"] or "P1"
+            continue
+
+        description = match["description"]
+        file_match = None
+        for file_match in TASK_FILE_RE.finditer(description):
+            pass  # Keep the last "in <path>" mention
+        tasks.append(
+            ParsedTask(
+                task_id=match["task_id"],
+                story=match["story"] or UNTAGGED_STORY,
+                priority=priority,
+                description=description,
+                file_path=file_match["path"] if file_match else "",
+            )
+        )
+    return tuple(tasks)
+
 
 # =============================================================================
 # T034: Manager agent base (polling, convoy creation, agent spawning)
@@ -38,6 +114,73 @@ class ManagerAgent:
     - Handle agent crashes and restarts
     """
 
+    __slots__ = (
+        "db_path",
+        "polling_interval",
+        "max_developers",
+        "max_testers",
+        "session_manager",
+        "settings",
+        "health_monitor",
+        "running",
+        "_wake",
+    )
+
+    # Kept as constants so the connection's statement cache reuses the plans
+    AGENT_SESSION_SQL = """
+        SELECT agent_type, convoy_id, current_task, worktree
+        FROM agent_sessions
+        WHERE agent_id = ?
+    """
+    # Bumps the failure count and, once it reaches the threshold, hands the
+    # task back for manual intervention - one write per failure
+    RECORD_TASK_FAILURE_SQL = """
+        UPDATE tasks
+        SET failure_count = failure_count + 1,
+            failure_reason = CASE
+                WHEN failure_count + 1 >= :threshold
+                THEN 'Escalated after ' || (failure_count + 1)
+                    || ' failures (' || :failure_type || ')'
+                ELSE 'Agent ' || :failure_type
+            END,
+            status = CASE
+                WHEN failure_count + 1 >= :threshold THEN 'todo' ELSE status
+            END,
+            assignee = CASE
+                WHEN failure_count + 1 >= :threshold THEN NULL ELSE assignee
+            END
+        WHERE id = :task_id
+        RETURNING failure_count
+    """
+
+    # T068: Failures on one task before it is escalated
+    ESCALATION_THRESHOLD = 3
+
+    # One round-trip per tick deciding which checks have anything to do;
+    # the thresholds mirror HealthMonitor's hung and stuck queries
+    TICK_PROBE_SQL = f"""
+        SELECT
+            (SELECT COUNT(*) FROM features WHERE status = 'ready'),
+            (SELECT COUNT(*) FROM agent_sessions WHERE status = 'active'),
+            (SELECT COUNT(*) FROM agent_sessions
+             WHERE status = 'active' AND last_heartbeat < ?),
+            (SELECT COUNT(*) FROM tasks
+             WHERE status IN ({", ".join("?" * len(ACTIVE_TASK_STATUSES))})
+             AND started_at < ?)
+    """
+
+    READY_FEATURES_SQL = """
+        SELECT id, spec_path FROM features
+        WHERE status = 'ready'
+        ORDER BY created_at
+    """
+
+    # Warm tmux sessions kept around so agent restarts skip a fork/exec
+    SESSION_POOL_SIZE = 2
+
+    # Shortest wait between polls; doubles while idle up to polling_interval
+    MIN_POLL_INTERVAL = 1.0
+
     def __init__(
         self,
         db_path: str = "~/.ai-sprint/beads.db",
@@ -60,21 +203,45 @@ class ManagerAgent:
         self.polling_interval = polling_interval
         self.max_developers = max_developers
         self.max_testers = max_testers
-        self.session_manager = SessionManager()
-        self.settings = settings or Settings()
+        self.session_manager = SessionManager(pool_size=self.SESSION_POOL_SIZE)
+        self.settings = settings or get_default_settings()
         self.health_monitor = HealthMonitor(self.db_path, self.settings)
         self.running = False
+        self._wake = threading.Event()
 
     def start(self) -> None:
-        """Start Manager agent polling loop."""
+        """
+        Start Manager agent polling loop.
+
+        The wait between polls starts at MIN_POLL_INTERVAL and doubles
+        while no ready features turn up, capped at polling_interval. Any
+        processed feature resets it, and notify() cuts a wait short.
+        """
         logger.info("Starting Manager agent")
         self.running = True
+        try:
+            self.session_manager.warm_pool()
+        except Exception as e:
+            # Spares only save spawn time; agents can still get fresh sessions
+            logger.warning("Could not warm tmux session pool: %s", e)
+        interval = min(self.MIN_POLL_INTERVAL, self.polling_interval)
 
         try:
             while self.running:
-                self._poll_features()
-                self._check_agent_health()
-                time.sleep(self.polling_interval)
+                try:
+                    processed = self._tick()
+                except sqlite3.OperationalError as e:
+                    # A locked database only costs this tick; retry on the next
+                    logger.error("Manager tick failed: %s", e)
+                    processed = 0
+
+                if processed:
+                    interval = min(self.MIN_POLL_INTERVAL, self.polling_interval)
+                else:
+                    interval = min(interval * 2, self.polling_interval)
+
+                self._wake.wait(timeout=interval)
+                self._wake.clear()
         except KeyboardInterrupt:
             logger.info("Manager agent stopped by user")
         finally:
@@ -84,15 +251,69 @@ class ManagerAgent:
         """Stop Manager agent."""
         logger.info("Stopping Manager agent")
         self.running = False
+        self._wake.set()
+
+    def notify(self) -> None:
+        """Wake the polling loop now, e.g. after marking a feature ready."""
+        self._wake.set()
+
+    def _tick_query(self, conn: sqlite3.Connection) -> tuple[int, int, int, int]:
+        """
+        Count pending work for every per-tick check in a single query.
+
+        Args:
+            conn: Database connection
+
+        Returns:
+            Tuple of (ready features, active agents, stale heartbeats,
+            over-long tasks)
+        """
+        now = datetime.now()
+        hung_before = (now - self.health_monitor.hung_threshold).isoformat()
+        stuck_before = (now - self.health_monitor.task_timeout).isoformat()
+        row = conn.execute(
+            self.TICK_PROBE_SQL,
+            (hung_before, *ACTIVE_TASK_STATUSES, stuck_before),
+        ).fetchone()
+        return tuple(row)
+
+    def _tick(self) -> int:
+        """
+        Run one polling tick, skipping checks the probe shows are idle.
+
+        Returns:
+            Number of ready features picked up this tick
+        """
+        with pooled_db(self.db_path, read_only=True) as conn:
+            ready, active, stale, long_running = self._tick_query(conn)
+
+        processed = self._poll_features() if ready else 0
+        self._check_agent_health(
+            check_crashed=active > 0,
+            check_hung=stale > 0,
+            check_stuck=long_running > 0,
+        )
+        return processed
+
+    def _poll_features(self) -> int:
+        """
+        Poll for ready features and process them.
+
+        Returns:
+            Number of ready features picked up this poll
+        """
+        with pooled_db(self.db_path, read_only=True) as ro_conn:
+            cursor = ro_conn.cursor()
+            cursor.row_factory = lambda _cursor, row: FeatureRow._make(row)
+            ready_features = cursor.execute(self.READY_FEATURES_SQL).fetchall()
 
-    def _poll_features(self) -> None:
-        """Poll for ready features and process them."""
-        with get_db(self.db_path) as conn:
-            ready_features = list_features_by_status(conn, "ready")
+        if not ready_features:
+            return 0
 
+        with pooled_db(self.db_path) as conn:
             for feature_row in ready_features:
-                feature_id = feature_row["id"]
-                logger.info(f"Processing feature: {feature_id}")
+                feature_id = feature_row.id
+                logger.info("Processing feature: %s", feature_id)
 
                 try:
                     # Update feature to in_progress
@@ -101,15 +322,17 @@ class ManagerAgent:
                     # Create convoys from tasks.md
                     self._create_convoys_from_tasks(conn, feature_row)
 
-                    logger.info(f"Feature {feature_id} convoys created")
+                    logger.info("Feature %s convoys created", feature_id)
                 except Exception as e:
-                    logger.error(f"Failed to process feature {feature_id}: {e}")
+                    logger.error("Failed to process feature %s: %s", feature_id, e)
                     update_feature_status(conn, feature_id, "failed")
 
+        return len(ready_features)
+
     def _create_convoys_from_tasks(
         self,
         conn: sqlite3.Connection,
-        feature_row: sqlite3.Row,
+        feature_row: FeatureRow,
     ) -> None:
         """
         Parse tasks.md and create convoy records.
@@ -118,27 +341,46 @@ class ManagerAgent:
             conn: Database connection
             feature_row: Feature record
         """
-        feature_id = feature_row["id"]
-        spec_path = Path(feature_row["spec_path"])
+        feature_id = feature_row.id
+        spec_path = Path(feature_row.spec_path)
         tasks_file = spec_path / "tasks.md"
 
         if not tasks_file.exists():
             raise FileNotFoundError(f"tasks.md not found: {tasks_file}")
 
-        # Parse tasks.md and extract convoys
-        # TODO: Implement tasks.md parser
-        # For now, create a placeholder convoy
-        logger.warning("tasks.md parser not implemented - creating placeholder convoy")
-
-        create_convoy(
-            conn,
-            convoy_id=f"{feature_id}-convoy-1",
-            feature_id=feature_id,
-            story="Placeholder Story",
-            priority="P1",
-            files=["placeholder.py"],
-            status="available",
-        )
+        # Parse tasks.md and group open tasks into one convoy per story
+        parsed = _parse_tasks_file(str(tasks_file), tasks_file.stat().st_mtime_ns)
+        if not parsed:
+            logger.warning("No open tasks in %s", tasks_file)
+            return
+
+        by_story: dict[str, list[ParsedTask]] = defaultdict(list)
+        for task in parsed:
+            by_story[task.story].append(task)
+
+        for story, tasks in by_story.items():
+            convoy_id = f"{feature_id}-{story.lower()}"
+            priority = min(task.priority for task in tasks)
+            create_convoy(
+                conn,
+                convoy_id=convoy_id,
+                feature_id=feature_id,
+                story=story,
+                priority=priority,
+                files=sorted({task.file_path for task in tasks if task.file_path}),
+                status="available",
+            )
+            for task in tasks:
+                create_task(
+                    conn,
+                    task_id=f"{feature_id}-{task.task_id}",
+                    convoy_id=convoy_id,
+                    title=task.task_id,
+                    description=task.description,
+                    file_path=task.file_path,
+                    priority=priority,
+                    acceptance_criteria=[],
+                )
 
     def spawn_developer(
         self,
@@ -154,11 +396,11 @@ class ManagerAgent:
             convoy_id: Convoy to assign
             worktree_path: Path to git worktree
         """
-        logger.info(f"Spawning Developer agent: {agent_id} for {convoy_id}")
+        logger.info("Spawning Developer agent: %s for %s", agent_id, convoy_id)
 
         # Create tmux session
         session = self.session_manager.create_session(
-            session_name=agent_id,
+            session_name=agent_session_name(agent_id),
             working_dir=worktree_path,
         )
 
@@ -188,11 +430,11 @@ class ManagerAgent:
             task_id: Task to validate
             worktree_path: Path to git worktree
         """
-        logger.info(f"Spawning Tester agent: {agent_id} for {task_id}")
+        logger.info("Spawning Tester agent: %s for %s", agent_id, task_id)
 
         # Create tmux session
         session = self.session_manager.create_session(
-            session_name=agent_id,
+            session_name=agent_session_name(agent_id),
             working_dir=worktree_path,
         )
 
@@ -208,111 +450,148 @@ class ManagerAgent:
             working_dir=worktree_path,
         )
 
-    def _check_agent_health(self) -> None:
+    def _check_agent_health(
+        self,
+        check_crashed: bool = True,
+        check_hung: bool = True,
+        check_stuck: bool = True,
+    ) -> None:
         """
         Check health of all active agents.
 
         Detects crashed, hung, or stuck agents and restarts them.
         Implementation of T062-T064.
+
+        Args:
+            check_crashed: Run crash detection
+            check_hung: Run hung agent detection
+            check_stuck: Run stuck task detection
         """
+        failures: list[tuple[str, str, Optional[str]]] = []
+        if not (check_crashed or check_hung or check_stuck):
+            return
+
+        # All three checks run in one HealthMonitor transaction
+        health = self.health_monitor.run_tick(
+            crashed=check_crashed, hung=check_hung, stuck=check_stuck
+        )
+
         # T062: Crash detection (missing process)
-        crashed = self.health_monitor.check_crashed_agents()
+        crashed = health["crashed"]
         for agent_id in crashed:
-            logger.warning(f"Agent {agent_id} crashed - attempting restart")
-            self._handle_agent_failure(agent_id, "crashed")
+            logger.warning("Agent %s crashed - attempting restart", agent_id)
+            failures.append((agent_id, "crashed", None))
 
         # T063: Hung agent detection (no heartbeat for 5 minutes)
-        hung = self.health_monitor.check_hung_agents()
+        hung = health["hung"]
         for agent_id in hung:
-            logger.warning(f"Agent {agent_id} hung - attempting restart")
-            self._handle_agent_failure(agent_id, "hung")
+            logger.warning("Agent %s hung - attempting restart", agent_id)
+            failures.append((agent_id, "hung", None))
 
         # T064: Stuck task detection (exceeding duration limit)
-        stuck_tasks = self.health_monitor.check_stuck_tasks()
+        stuck_tasks = health["stuck"]
         for stuck_info in stuck_tasks:
             agent_id = stuck_info["agent_id"]
             task_id = stuck_info["task_id"]
             duration = stuck_info["duration_seconds"]
             logger.warning(
-                f"Task {task_id} stuck on {agent_id} for {duration:.0f}s - attempting restart"
+                "Task %s stuck on %s for %.0fs - attempting restart",
+                task_id,
+                agent_id,
+                duration,
             )
-            self._handle_agent_failure(agent_id, "stuck", task_id)
+            failures.append((agent_id, "stuck", task_id))
 
-    def _handle_agent_failure(
+        if failures:
+            self._handle_agent_failures(failures)
+
+    def _handle_agent_failures(
         self,
-        agent_id: str,
-        failure_type: str,
-        task_id: Optional[str] = None,
+        failures: list[tuple[str, str, Optional[str]]],
     ) -> None:
         """
-        Handle agent failure by attempting restart or escalation.
+        Handle agent failures by attempting restart or escalation.
 
+        All failures from one health check share a connection; escalations
+        and failed-restart events are each written as one batch.
         Implementation of T065-T068.
 
         Args:
-            agent_id: Failed agent identifier
-            failure_type: Type of failure (crashed, hung, stuck)
-            task_id: Optional task ID if failure is task-specific
+            failures: (agent_id, failure_type, task_id) tuples, where
+                failure_type is crashed, hung or stuck and task_id is set
+                for task-specific failures
         """
-        # T067: Track failure count
-        if task_id:
-            with get_db(self.db_path) as conn:
-                failure_count = increment_task_failure_count(
-                    conn, task_id, f"Agent {failure_type}"
-                )
-
-                # T068: Escalate after 3 failures
-                if failure_count >= 3:
-                    logger.error(
-                        f"Task {task_id} failed {failure_count} times - escalating"
-                    )
-                    publish_event(
-                        conn,
-                        agent_id="architect",
-                        event_type="ESCALATE_TASK",
-                        payload={
-                            "task_id": task_id,
-                            "failure_count": failure_count,
+        events: list[tuple[str, str, dict]] = []
+        to_restart: list[tuple[str, str, Optional[str]]] = []
+
+        with pooled_db(self.db_path) as conn:
+            for agent_id, failure_type, task_id in failures:
+                # T067: Track failure count
+                if task_id:
+                    row = conn.execute(
+                        self.RECORD_TASK_FAILURE_SQL,
+                        {
+                            "threshold": self.ESCALATION_THRESHOLD,
                             "failure_type": failure_type,
-                            "last_agent": agent_id,
+                            "task_id": task_id,
                         },
-                    )
-                    # Mark task as requiring manual intervention
-                    conn.execute(
-                        """
-                        UPDATE tasks
-                        SET status = 'todo',
-                            assignee = NULL,
-                            failure_reason = ?
-                        WHERE id = ?
-                        """,
-                        (
-                            f"Escalated after {failure_count} failures ({failure_type})",
+                    ).fetchone()
+                    failure_count = row[0] if row else 0
+
+                    # T068: Escalate after 3 failures
+                    if failure_count >= self.ESCALATION_THRESHOLD:
+                        logger.error(
+                            "Task %s failed %s times - escalating",
                             task_id,
-                        ),
-                    )
-                    conn.commit()
-                    return
+                            failure_count,
+                        )
+                        events.append(
+                            (
+                                "architect",
+                                "ESCALATE_TASK",
+                                {
+                                    "task_id": task_id,
+                                    "failure_count": failure_count,
+                                    "failure_type": failure_type,
+                                    "last_agent": agent_id,
+                                },
+                            )
+                        )
+                        continue
+
+                to_restart.append((agent_id, failure_type, task_id))
+
+            # The escalation events' commit also covers the failure updates
+            if events:
+                publish_events(conn, events)
+            else:
+                conn.commit()
 
         # T065: Automatic agent restart
-        try:
-            self._restart_agent(agent_id)
-        except Exception as e:
-            logger.error(f"Failed to restart agent {agent_id}: {e}")
-            # Publish crash event for monitoring
-            with get_db(self.db_path) as conn:
-                publish_event(
-                    conn,
-                    agent_id="manager",
-                    event_type="AGENT_RESTART_FAILED",
-                    payload={
-                        "agent_id": agent_id,
-                        "failure_type": failure_type,
-                        "task_id": task_id,
-                        "error": str(e),
-                    },
+        restart_failures: list[tuple[str, str, dict]] = []
+        for agent_id, failure_type, task_id in to_restart:
+            try:
+                self._restart_agent(agent_id)
+            except Exception as e:
+                logger.error("Failed to restart agent %s: %s", agent_id, e)
+                restart_failures.append(
+                    (
+                        "manager",
+                        "AGENT_RESTART_FAILED",
+                        {
+                            "agent_id": agent_id,
+                            "failure_type": failure_type,
+                            "task_id": task_id,
+                            "error": str(e),
+                        },
+                    )
                 )
 
+        if restart_failures:
+            # Publish crash events for monitoring
+            with pooled_db(self.db_path) as conn:
+                publish_events(conn, restart_failures)
+
     def _restart_agent(self, agent_id: str) -> None:
         """
         Restart a crashed or hung agent.
@@ -322,28 +601,21 @@ class ManagerAgent:
         Args:
             agent_id: Agent to restart
         """
-        logger.info(f"Restarting agent: {agent_id}")
+        logger.info("Restarting agent: %s", agent_id)
 
         # Destroy old session
         try:
-            self.session_manager.destroy_session(f"ai-sprint-{agent_id}")
+            self.session_manager.destroy_session(agent_session_name(agent_id))
         except ValueError:
             pass  # Session already gone
 
         # T066: State recovery - get agent info from database
-        with get_db(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT agent_type, convoy_id, current_task, worktree
-                FROM agent_sessions
-                WHERE agent_id = ?
-                """,
-                (agent_id,),
-            )
+        with pooled_db(self.db_path, read_only=True) as conn:
+            cursor = conn.execute(self.AGENT_SESSION_SQL, (agent_id,))
             row = cursor.fetchone()
 
             if not row:
-                logger.error(f"Agent {agent_id} not found in database")
+                logger.error("Agent %s not found in database", agent_id)
                 return
 
             agent_type = row[0]
@@ -355,20 +627,24 @@ class ManagerAgent:
         if agent_type == "developer":
             if convoy_id and worktree:
                 logger.info(
-                    f"Respawning Developer {agent_id} with convoy {convoy_id}"
+                    "Respawning Developer %s with convoy %s",
+                    agent_id,
+                    convoy_id,
                 )
                 self.spawn_developer(agent_id, convoy_id, worktree)
             else:
                 logger.warning(
-                    f"Developer {agent_id} missing convoy or worktree - cannot restart"
+                    "Developer %s missing convoy or worktree - cannot restart",
+                    agent_id,
                 )
         elif agent_type == "tester":
             if current_task and worktree:
-                logger.info(f"Respawning Tester {agent_id} with task {current_task}")
+                logger.info("Respawning Tester %s with task %s", agent_id, current_task)
                 self.spawn_tester(agent_id, current_task, worktree)
             else:
                 logger.warning(
-                    f"Tester {agent_id} missing task or worktree - cannot restart"
+                    "Tester %s missing task or worktree - cannot restart",
+                    agent_id,
                 )
         else:
-            logger.warning(f"Unknown agent type {agent_type} for {agent_id}")
+            logger.warning("Unknown agent type %s for %s", agent_type, agent_id)
@@ -1,24 +1,59 @@
 """Refinery agent - merge operations."""
 
-import sqlite3
+import re
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 import git
+from git.objects.util import altz_to_utctz_str
 
-from ai_sprint.config.settings import Settings
+try:
+    import pygit2
+except ImportError:  # Optional "fast" extra
+    pygit2 = None
+
+from ai_sprint.config.settings import Settings, get_default_settings
 from ai_sprint.services.quality_gates import QualityGateRunner
 from ai_sprint.services.state_manager import (
-    get_db,
     get_task,
-    list_tasks_by_convoy,
+    get_tasks,
+    list_task_ids_by_completion,
+    pooled_db,
     publish_event,
+    publish_events,
     update_task_status,
+    update_task_statuses,
 )
 from ai_sprint.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Git failure classification, matched against the command's output streams
+FF_NOT_POSSIBLE_RE = re.compile(r"not possible to fast-forward", re.IGNORECASE)
+CONFLICT_RE = re.compile(r"conflict", re.IGNORECASE)
+
+
+def _git_error_matches(pattern: re.Pattern[str], error: git.GitCommandError) -> bool:
+    """
+    Check a failed git command's stderr and stdout for a pattern.
+
+    Args:
+        pattern: Compiled pattern to search for
+        error: Failed git command
+
+    Returns:
+        True if either stream matches
+    """
+    return bool(pattern.search(error.stderr or "") or pattern.search(error.stdout or ""))
+
+
+class MergeSummary(NamedTuple):
+    """Outcome of one process_merge_queue() run."""
+
+    merged: list[str]
+    failed: list[str]
+    total: int
+
 
 # =============================================================================
 # T036: Refinery agent base (merge operations)
@@ -36,6 +71,9 @@ class RefineryAgent:
     - Trigger documentation updates
     """
 
+    # `git merge-tree --write-tree` lets the queue be merged without checkouts
+    IN_MEMORY_MERGE_GIT_VERSION = (2, 38)
+
     def __init__(
         self,
         db_path: str = "~/.ai-sprint/beads.db",
@@ -48,8 +86,10 @@ class RefineryAgent:
             db_path: Path to SQLite database
             settings: Application settings
         """
-        self.db_path = db_path
-        self.settings = settings or Settings()
+        self.db_path = Path(db_path).expanduser()
+        self.settings = settings or get_default_settings()
+        # libgit2 handles keyed by working tree, reused across merges
+        self._repos: dict[str, Any] = {}
 
     def merge_task(self, task_id: str, worktree_path: Path) -> bool:
         """
@@ -66,7 +106,7 @@ class RefineryAgent:
         """
         logger.info(f"Merging task: {task_id}")
 
-        with get_db(self.db_path) as conn:
+        with pooled_db(self.db_path) as conn:
             task = get_task(conn, task_id)
             if not task:
                 logger.error(f"Task not found: {task_id}")
@@ -90,8 +130,8 @@ class RefineryAgent:
 
             logger.info(f"Task {task_id} passed all security gates")
 
-            # Mark task as done
-            update_task_status(conn, task_id, "done")
+            # Mark task as done; the event's commit covers it
+            update_task_status(conn, task_id, "done", commit=False)
 
             # Publish merge success event
             publish_event(
@@ -115,19 +155,7 @@ class RefineryAgent:
             task_id: Task to reject
             reason: Rejection reason (security issues, conflicts, etc.)
         """
-        logger.info(f"Rejecting merge for {task_id}: {reason}")
-
-        with get_db(self.db_path) as conn:
-            # Send back to in_progress
-            update_task_status(conn, task_id, "in_progress")
-
-            # Publish rework event
-            publish_event(
-                conn,
-                agent_id="developer",
-                event_type="REWORK_NEEDED",
-                payload={"task_id": task_id, "reason": reason},
-            )
+        self._record_merge_results([], [(task_id, reason)])
 
     def trigger_documentation(self, convoy_id: str) -> None:
         """
@@ -138,7 +166,7 @@ class RefineryAgent:
         """
         logger.info(f"Triggering documentation for convoy: {convoy_id}")
 
-        with get_db(self.db_path) as conn:
+        with pooled_db(self.db_path) as conn:
             publish_event(
                 conn,
                 agent_id="librarian",
@@ -160,60 +188,249 @@ class RefineryAgent:
         Returns:
             List of task IDs ready for merge, ordered by completion time
         """
-        with get_db(self.db_path) as conn:
-            tasks = list_tasks_by_convoy(conn, convoy_id, status="in_docs")
-
-            # Sort by completed_at timestamp
-            sorted_tasks = sorted(
-                tasks,
-                key=lambda t: t["completed_at"] or "",
-            )
-
-            return [t["id"] for t in sorted_tasks]
+        with pooled_db(self.db_path, read_only=True) as conn:
+            return list_task_ids_by_completion(conn, convoy_id, status="in_docs")
 
     def process_merge_queue(
         self,
         convoy_id: str,
         repo_path: Path,
         target_branch: str = "main",
-    ) -> dict[str, Any]:
+    ) -> MergeSummary:
         """
         Process all tasks in merge queue sequentially.
 
+        Git work runs task by task; the resulting status updates and rework
+        events are written afterwards in a single transaction, so the
+        database is not locked while merges run.
+
         Args:
             convoy_id: Convoy identifier
             repo_path: Path to main git repository
             target_branch: Branch to merge into
 
         Returns:
-            Summary dict with keys: merged, failed, total
+            MergeSummary of merged and failed task IDs
         """
         queue = self.get_merge_queue(convoy_id)
-        merged = []
-        failed = []
-
         logger.info(f"Processing merge queue for {convoy_id}: {len(queue)} tasks")
+        return self.merge_tasks(queue, repo_path, target_branch)
 
+    def merge_tasks(
+        self,
+        queue: list[str],
+        repo_path: Path,
+        target_branch: str = "main",
+    ) -> MergeSummary:
+        """
+        Merge tasks in order and record the outcomes.
+
+        Unknown task IDs count as failed without being recorded. If the
+        repository or target branch cannot be used, every task is rejected.
+
+        Args:
+            queue: Task IDs in merge order
+            repo_path: Path to main git repository
+            target_branch: Branch to merge into
+
+        Returns:
+            MergeSummary of merged and failed task IDs
+        """
+        merged: list[str] = []
+        failed: list[str] = []
+        rejected: list[tuple[str, str]] = []
+
+        if not queue:
+            return MergeSummary(merged, failed, 0)
+
+        with pooled_db(self.db_path, read_only=True) as conn:
+            known = get_tasks(conn, queue)
         for task_id in queue:
-            try:
-                # Get task worktree path from task metadata
-                # TODO: Store worktree path in task or agent_session
-                worktree_path = repo_path / "worktrees" / f"task-{task_id}"
+            if task_id not in known:
+                logger.error(f"Task not found: {task_id}")
+                failed.append(task_id)
+        tasks = [task_id for task_id in queue if task_id in known]
+
+        try:
+            repo = git.Repo(repo_path)
+            if repo.git.version_info >= self.IN_MEMORY_MERGE_GIT_VERSION:
+                merged, rejected = self._merge_queue_in_memory(repo, tasks, target_branch)
+            else:
+                for task_id in tasks:
+                    # TODO: Lookup worktree path and branch from agent_session
+                    reason = self._merge_branch(task_id, repo, target_branch)
+                    if reason is None:
+                        merged.append(task_id)
+                    else:
+                        rejected.append((task_id, reason))
+        except Exception as e:
+            logger.error(f"Failed to merge queue into {target_branch}: {e}")
+            merged = []
+            rejected = [(task_id, f"Merge failed: {e}") for task_id in tasks]
+
+        failed.extend(task_id for task_id, _ in rejected)
+        if merged or rejected:
+            self._record_merge_results(merged, rejected)
+
+        return MergeSummary(merged, failed, len(queue))
+
+    def _merge_queue_in_memory(
+        self,
+        repo: git.Repo,
+        queue: list[str],
+        target_branch: str,
+    ) -> tuple[list[str], list[tuple[str, str]]]:
+        """
+        Merge a whole queue without touching the working tree per task.
+
+        Each branch is fast-forwarded or replayed onto a running tip with
+        `git merge-tree --write-tree`, so only objects are written. The
+        target ref moves once at the end, and the working tree is updated
+        only if the target is checked out.
+
+        Args:
+            repo: Git repository
+            queue: Task IDs in merge order
+            target_branch: Branch to merge into
+
+        Returns:
+            (merged task IDs, (task_id, reason) pairs for rejected tasks)
+        """
+        merged: list[str] = []
+        rejected: list[tuple[str, str]] = []
 
-                if self.merge_task_ff(task_id, repo_path, target_branch):
-                    merged.append(task_id)
+        start_oid = repo.git.rev_parse(f"refs/heads/{target_branch}")
+        tip = start_oid
+        rebased: dict[str, tuple[str, str]] = {}
+
+        for task_id in queue:
+            # TODO: Lookup worktree path and branch from agent_session
+            branch_name = f"task-{task_id}"
+            try:
+                branch_oid = repo.git.rev_parse(f"refs/heads/{branch_name}")
+                new_tip = self._replay_onto(repo, tip, branch_oid)
+            except git.GitCommandError as e:
+                if _git_error_matches(CONFLICT_RE, e):
+                    logger.error(f"Rebase conflicts for {task_id}")
+                    rejected.append((task_id, f"Rebase conflicts: {e}"))
                 else:
-                    failed.append(task_id)
+                    logger.error(f"Fast-forward merge failed for {task_id}: {e}")
+                    rejected.append((task_id, f"Merge failed: {e}"))
+                continue
 
-            except Exception as e:
-                logger.error(f"Failed to merge {task_id}: {e}")
-                failed.append(task_id)
+            if new_tip != branch_oid and new_tip != tip:
+                rebased[branch_name] = (new_tip, branch_oid)
+            tip = new_tip
+            merged.append(task_id)
+
+        if tip == start_oid:
+            return merged, rejected
+
+        try:
+            if repo.head.is_detached or repo.active_branch.name != target_branch:
+                repo.git.update_ref(f"refs/heads/{target_branch}", tip, start_oid)
+            else:
+                repo.git.merge(tip, "--ff-only")
+        except git.GitCommandError as e:
+            logger.error(f"Could not advance {target_branch}: {e}")
+            rejected.extend((task_id, f"Merge failed: {e}") for task_id in merged)
+            return [], rejected
+
+        # Point rebased task branches at their replayed commits, as a rebase would
+        for branch_name, (new_oid, old_oid) in rebased.items():
+            try:
+                repo.git.update_ref(f"refs/heads/{branch_name}", new_oid, old_oid)
+            except git.GitCommandError as e:
+                logger.warning(f"Failed to update branch {branch_name}: {e}")
+
+        logger.info(f"Advanced {target_branch} over {len(merged)} tasks")
+        return merged, rejected
+
+    def _replay_onto(self, repo: git.Repo, onto: str, branch_oid: str) -> str:
+        """
+        Compute the commit a branch fast-forwards or rebases to on onto.
+
+        Args:
+            repo: Git repository
+            onto: Commit to build on
+            branch_oid: Tip of the branch to merge
+
+        Returns:
+            OID of the new tip containing both histories
+
+        Raises:
+            git.GitCommandError: If a commit does not apply cleanly
+        """
+        if repo.is_ancestor(onto, branch_oid):
+            return branch_oid
+        if repo.is_ancestor(branch_oid, onto):
+            return onto
+
+        # Like `git rebase`, merge commits are dropped
+        commits = repo.git.rev_list("--reverse", "--no-merges", f"{onto}..{branch_oid}").split()
+        tip = onto
+        for oid in commits:
+            # The merge base of onto and each branch commit is the fork
+            # point, so the merged tree is that commit's change set on onto
+            tree = repo.git.merge_tree("--write-tree", onto, oid).splitlines()[0]
+            commit = repo.commit(oid)
+            tip = repo.git.commit_tree(
+                tree,
+                "-p",
+                tip,
+                "-m",
+                commit.message,
+                env={
+                    "GIT_AUTHOR_NAME": commit.author.name,
+                    "GIT_AUTHOR_EMAIL": commit.author.email,
+                    "GIT_AUTHOR_DATE": (
+                        f"{commit.authored_date} {altz_to_utctz_str(commit.author_tz_offset)}"
+                    ),
+                },
+            )
+        return tip
+
+    def _record_merge_results(
+        self,
+        merged: list[str],
+        rejected: list[tuple[str, str]],
+    ) -> None:
+        """
+        Write merge outcomes with a single commit.
 
-        return {
-            "merged": merged,
-            "failed": failed,
-            "total": len(queue),
-        }
+        Merged tasks become done; rejected tasks go back to in_progress
+        with a REWORK_NEEDED event for the developer.
+
+        Args:
+            merged: Task IDs that merged cleanly
+            rejected: (task_id, reason) pairs for tasks that did not
+        """
+        for task_id, reason in rejected:
+            logger.info(f"Rejecting merge for {task_id}: {reason}")
+
+        with pooled_db(self.db_path) as conn:
+            update_task_statuses(
+                conn,
+                [(task_id, "done") for task_id in merged]
+                + [(task_id, "in_progress") for task_id, _ in rejected],
+                commit=False,
+            )
+
+            if rejected:
+                # The events' commit covers the status updates too
+                publish_events(
+                    conn,
+                    [
+                        (
+                            "developer",
+                            "REWORK_NEEDED",
+                            {"task_id": task_id, "reason": reason},
+                        )
+                        for task_id, reason in rejected
+                    ],
+                )
+            else:
+                conn.commit()
 
     # =========================================================================
     # T059: Fast-forward merge strategy
@@ -236,46 +453,127 @@ class RefineryAgent:
         Returns:
             True if merge succeeded, False otherwise
         """
-        logger.info(f"Fast-forward merging task {task_id} into {target_branch}")
+        with pooled_db(self.db_path, read_only=True) as conn:
+            if not get_task(conn, task_id):
+                logger.error(f"Task not found: {task_id}")
+                return False
 
         try:
             repo = git.Repo(repo_path)
+        except Exception as e:
+            reason = f"Merge failed: {e}"
+        else:
+            reason = self._merge_branch(task_id, repo, target_branch)
 
-            with get_db(self.db_path) as conn:
-                task = get_task(conn, task_id)
-                if not task:
-                    logger.error(f"Task not found: {task_id}")
-                    return False
+        if reason is None:
+            self._record_merge_results([task_id], [])
+            return True
 
-                # Get branch name for this task
-                # TODO: Lookup branch from worktree or agent_session
-                branch_name = f"task-{task_id}"
+        self._record_merge_results([], [(task_id, reason)])
+        return False
 
-                # Checkout target branch
-                repo.git.checkout(target_branch)
+    def _merge_branch(
+        self,
+        task_id: str,
+        repo: git.Repo,
+        target_branch: str,
+    ) -> Optional[str]:
+        """
+        Fast-forward a task branch into target, rebasing first if needed.
 
-                # Attempt fast-forward merge
-                try:
-                    repo.git.merge(branch_name, "--ff-only")
-                    logger.info(f"Fast-forward merge succeeded for {task_id}")
+        Args:
+            task_id: Task to merge
+            repo: Git repository
+            target_branch: Branch to merge into
 
-                    # Mark task as done
-                    update_task_status(conn, task_id, "done")
+        Returns:
+            None on success, otherwise the rejection reason
+        """
+        logger.info(f"Fast-forward merging task {task_id} into {target_branch}")
 
-                    return True
+        # Get branch name for this task
+        # TODO: Lookup branch from worktree or agent_session
+        branch_name = f"task-{task_id}"
 
+        try:
+            fast_forwarded = self._fast_forward_in_process(repo, branch_name, target_branch)
+
+            if fast_forwarded is None:
+                # pygit2 not installed - checkout and merge with the git CLI
+                repo.git.checkout(target_branch)
+                try:
+                    repo.git.merge(branch_name, "--ff-only")
+                    fast_forwarded = True
                 except git.GitCommandError as e:
-                    if "not possible to fast-forward" in str(e):
-                        logger.warning(f"Fast-forward not possible for {task_id} - attempting rebase")
-                        return self.rebase_and_merge(task_id, repo, branch_name, target_branch)
-                    else:
+                    if not _git_error_matches(FF_NOT_POSSIBLE_RE, e):
                         raise
+                    fast_forwarded = False
+
+            if fast_forwarded:
+                logger.info(f"Fast-forward merge succeeded for {task_id}")
+                return None
+
+            logger.warning(f"Fast-forward not possible for {task_id} - attempting rebase")
+            return self._rebase_branch(task_id, repo, branch_name, target_branch)
 
         except Exception as e:
             logger.error(f"Fast-forward merge failed for {task_id}: {e}")
-            self.reject_merge(task_id, f"Merge failed: {e}")
+            return f"Merge failed: {e}"
+
+    def _libgit2_repo(self, repo: git.Repo) -> Any:
+        """
+        Get the cached pygit2 handle for a repository.
+
+        Args:
+            repo: GitPython repository
+
+        Returns:
+            pygit2.Repository for the same working tree
+        """
+        key = str(repo.working_tree_dir)
+        handle = self._repos.get(key)
+        if handle is None:
+            handle = self._repos[key] = pygit2.Repository(key)
+        return handle
+
+    def _fast_forward_in_process(
+        self,
+        repo: git.Repo,
+        branch_name: str,
+        target_branch: str,
+    ) -> Optional[bool]:
+        """
+        Check out target and fast-forward it to branch without forking git.
+
+        Args:
+            repo: Git repository
+            branch_name: Task branch to merge
+            target_branch: Branch to merge into
+
+        Returns:
+            True if target now contains branch, False if a rebase is
+            needed, None if pygit2 is not installed
+        """
+        if pygit2 is None:
+            return None
+
+        lg_repo = self._libgit2_repo(repo)
+        target = lg_repo.branches.local[target_branch]
+        branch_oid = lg_repo.branches.local[branch_name].target
+
+        if not target.is_head():
+            lg_repo.checkout(target)
+
+        target_oid = target.target
+        if branch_oid == target_oid or lg_repo.descendant_of(target_oid, branch_oid):
+            return True  # Already up to date
+        if not lg_repo.descendant_of(branch_oid, target_oid):
             return False
 
+        lg_repo.checkout_tree(lg_repo[branch_oid])
+        target.set_target(branch_oid, f"merge {branch_name}: Fast-forward")
+        return True
+
     # =========================================================================
     # T060: Rebase before merge
     # =========================================================================
@@ -299,6 +597,33 @@ class RefineryAgent:
         Returns:
             True if rebase and merge succeeded, False otherwise
         """
+        reason = self._rebase_branch(task_id, repo, branch_name, target_branch)
+        if reason is None:
+            self._record_merge_results([task_id], [])
+            return True
+
+        self._record_merge_results([], [(task_id, reason)])
+        return False
+
+    def _rebase_branch(
+        self,
+        task_id: str,
+        repo: git.Repo,
+        branch_name: str,
+        target_branch: str,
+    ) -> Optional[str]:
+        """
+        Rebase branch onto target and fast-forward target to it.
+
+        Args:
+            task_id: Task identifier
+            repo: Git repository
+            branch_name: Branch to rebase
+            target_branch: Branch to rebase onto
+
+        Returns:
+            None on success, otherwise the rejection reason
+        """
         logger.info(f"Rebasing {branch_name} onto {target_branch}")
 
         try:
@@ -315,19 +640,15 @@ class RefineryAgent:
             repo.git.merge(branch_name, "--ff-only")
 
             logger.info(f"Rebase and merge succeeded for {task_id}")
-
-            with get_db(self.db_path) as conn:
-                update_task_status(conn, task_id, "done")
-
-            return True
+            return None
 
         except git.GitCommandError as e:
-            if "conflict" in str(e).lower():
+            if _git_error_matches(CONFLICT_RE, e):
                 logger.error(f"Rebase conflicts for {task_id}")
-                self.reject_merge(task_id, f"Rebase conflicts: {e}")
+                reason = f"Rebase conflicts: {e}"
             else:
                 logger.error(f"Rebase failed for {task_id}: {e}")
-                self.reject_merge(task_id, f"Rebase failed: {e}")
+                reason = f"Rebase failed: {e}"
 
             # Abort rebase
             try:
@@ -335,7 +656,7 @@ class RefineryAgent:
             except Exception:
                 pass
 
-            return False
+            return reason
 
     def cleanup_merged_branch(
         self,
@@ -351,6 +672,26 @@ class RefineryAgent:
         """
         logger.info(f"Cleaning up merged branch: {branch_name}")
 
+        if pygit2 is not None:
+            lg_repo = self._libgit2_repo(repo)
+            branch = lg_repo.branches.local.get(branch_name)
+            if branch is None:
+                logger.warning(f"Failed to delete branch {branch_name}: not found")
+                return
+
+            # Match `git branch -d`: refuse to drop unmerged work
+            head_oid = lg_repo.head.target
+            if branch.target != head_oid and not lg_repo.descendant_of(head_oid, branch.target):
+                logger.warning(f"Failed to delete branch {branch_name}: not fully merged")
+                return
+
+            try:
+                branch.delete()
+                logger.info(f"Branch deleted: {branch_name}")
+            except pygit2.GitError as e:
+                logger.warning(f"Failed to delete branch {branch_name}: {e}")
+            return
+
         try:
             repo.git.branch("-d", branch_name)
             logger.info(f"Branch deleted: {branch_name}")
@@ -1,18 +1,23 @@
 """Tester agent - validation execution."""
 
+import os
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from ai_sprint.config.settings import Settings
-from ai_sprint.services.quality_gates import QualityGateRunner
+from ai_sprint.config.settings import Settings, get_default_settings
+from ai_sprint.services.quality_gates import GateType, QualityGateRunner
 from ai_sprint.services.state_manager import (
+    acknowledge_events,
     consume_events,
-    get_db,
     get_task,
-    publish_event,
-    update_task_status,
+    get_tasks,
+    load_payload,
+    pooled_db,
+    publish_events,
+    update_task_statuses,
     update_task_validation_results,
 )
 from ai_sprint.utils.logging import get_logger
@@ -53,19 +58,75 @@ class TesterAgent:
             settings: Application settings
         """
         self.agent_id = agent_id
-        self.db_path = db_path
+        self.db_path = Path(db_path).expanduser()
         self.worktree_path = worktree_path or Path.cwd()
-        self.settings = settings or Settings()
+        self.settings = settings or get_default_settings()
 
     def process_events(self) -> None:
-        """Process RUN_TESTS events."""
-        with get_db(self.db_path) as conn:
+        """
+        Process RUN_TESTS events.
+
+        Events are routed through the _HANDLERS table. Referenced tasks
+        are fetched with one query and test gates run outside any
+        transaction, once per distinct worktree and concurrently across
+        worktrees. All status changes, validation results, follow-up
+        events and event acknowledgements are then written with a single
+        commit.
+        """
+        with pooled_db(self.db_path) as conn:
             events = consume_events(conn, self.agent_id, limit=10)
+            if not events:
+                return
 
+            task_ids: list[str] = []
             for event in events:
-                if event["event_type"] == "RUN_TESTS":
-                    task_id = event["payload"]["task_id"]
-                    self.validate_task(task_id)
+                handler = self._HANDLERS.get(event["event_type"])
+                if handler is not None:
+                    task_id = handler(self, load_payload(event["payload"]))
+                    if task_id is not None:
+                        task_ids.append(task_id)
+            # Repeated RUN_TESTS events for a task validate it once
+            task_ids = list(dict.fromkeys(task_ids))
+            tasks = get_tasks(conn, task_ids)
+
+            ready = [
+                task_id
+                for task_id in task_ids
+                if self._ready_for_tests(task_id, tasks.get(task_id))
+            ]
+            # One timestamp for the whole batch
+            outcomes = self._run_test_gates_batch(ready, datetime.now().isoformat())
+
+            passed: dict[str, dict[str, Any]] = {}
+            rejected: list[tuple[str, str]] = []
+            for task_id in ready:
+                validation_results, failure_message = outcomes[task_id]
+                if failure_message is None:
+                    passed[task_id] = validation_results
+                else:
+                    rejected.append((task_id, failure_message))
+
+            self._record_validations(conn, passed, rejected, commit=False)
+
+            # Commits the batch above together with the acknowledgements
+            acknowledge_events(conn, [event["id"] for event in events])
+
+    def _on_run_tests(self, payload: dict[str, Any]) -> Optional[str]:
+        """
+        Handle a RUN_TESTS event.
+
+        Args:
+            payload: Decoded event payload
+
+        Returns:
+            Task ID to validate in this batch
+        """
+        return payload["task_id"]
+
+    # Event type -> handler returning the task to validate, if any
+    _HANDLERS: dict[str, Callable[["TesterAgent", dict[str, Any]], Optional[str]]] = {
+        "RUN_TESTS": _on_run_tests,
+    }
 
     def validate_task(self, task_id: str) -> bool:
         """
@@ -79,60 +140,175 @@ class TesterAgent:
         Returns:
             True if validation passed, False otherwise
         """
+        with pooled_db(self.db_path) as conn:
+            if not self._ready_for_tests(task_id, get_task(conn, task_id)):
+                return False
+
         logger.info(f"Validating task: {task_id}")
+        validation_results, failure_message = self._run_test_gates(
+            self._task_worktree(task_id), datetime.now().isoformat()
+        )
 
-        with get_db(self.db_path) as conn:
-            task = get_task(conn, task_id)
-            if not task:
-                logger.error(f"Task not found: {task_id}")
-                return False
+        with pooled_db(self.db_path) as conn:
+            if failure_message is None:
+                self._record_validations(conn, {task_id: validation_results}, [])
+                return True
 
-            if task["status"] != "in_tests":
-                logger.error(f"Task {task_id} not in testing status")
-                return False
+            self._record_validations(conn, {}, [(task_id, failure_message)])
+            return False
 
-            # Run test quality gates
-            runner = QualityGateRunner(self.settings, self.worktree_path)
-            results = runner.run_all_gates(stage="tests")
-
-            if runner.all_gates_passed():
-                logger.info(f"Task {task_id} passed test quality gates")
-
-                # Store validation results
-                validation_results = {
-                    "coverage_percent": next(
-                        (r.score for r in results if r.gate_type.value == "coverage"),
-                        None,
-                    ),
-                    "mutation_score": next(
-                        (r.score for r in results if r.gate_type.value == "mutation"),
-                        None,
-                    ),
-                    "tests_passed": True,
-                    "validated_at": datetime.now().isoformat(),
-                }
-
-                update_task_validation_results(conn, task_id, validation_results)
-
-                # Move to in_docs status
-                update_task_status(conn, task_id, "in_docs")
-
-                # Publish event to Refinery
-                publish_event(
-                    conn,
-                    agent_id="refinery",
-                    event_type="SECURITY_SCAN",
-                    payload={"task_id": task_id},
-                )
+    def _ready_for_tests(self, task_id: str, task: Optional[sqlite3.Row]) -> bool:
+        """
+        Check that a task exists and is waiting for tests.
 
-                return True
-            else:
-                # Failed test gates - reject with specific feedback
-                failure_message = runner.get_failure_message()
-                logger.warning(f"Task {task_id} failed test gates: {failure_message}")
+        Args:
+            task_id: Task identifier
+            task: Task row, or None if it was not found
 
-                self.reject_validation(task_id, failure_message)
-                return False
+        Returns:
+            True if the task can be validated
+        """
+        if not task:
+            logger.error(f"Task not found: {task_id}")
+            return False
+
+        if task["status"] != "in_tests":
+            logger.error(f"Task {task_id} not in testing status")
+            return False
+
+        return True
+
+    def _task_worktree(self, task_id: str) -> Path:
+        """
+        Get the worktree holding a task's implementation.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Worktree to run test gates in
+        """
+        # TODO: Lookup worktree path from agent_session
+        return self.worktree_path
+
+    def _run_test_gates_batch(
+        self,
+        task_ids: list[str],
+        validated_at: str,
+    ) -> dict[str, tuple[dict[str, Any], Optional[str]]]:
+        """
+        Run test gates for several tasks, concurrently across worktrees.
+
+        Gates only see the worktree's contents, so tasks sharing a
+        worktree share one run. Gate tools are subprocesses, so threads
+        are enough to overlap them.
+
+        Args:
+            task_ids: Tasks to validate
+            validated_at: ISO timestamp recorded for every task
+
+        Returns:
+            _run_test_gates() outcome keyed by task ID
+        """
+        if not task_ids:
+            return {}
+
+        by_worktree: dict[Path, list[str]] = {}
+        for task_id in task_ids:
+            logger.info(f"Validating task: {task_id}")
+            by_worktree.setdefault(self._task_worktree(task_id), []).append(task_id)
+
+        workers = min(len(by_worktree), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                worktree: pool.submit(self._run_test_gates, worktree, validated_at)
+                for worktree in by_worktree
+            }
+
+        outcomes: dict[str, tuple[dict[str, Any], Optional[str]]] = {}
+        for worktree, worktree_task_ids in by_worktree.items():
+            outcome = futures[worktree].result()
+            for task_id in worktree_task_ids:
+                outcomes[task_id] = outcome
+        return outcomes
+
+    def _run_test_gates(
+        self,
+        worktree_path: Path,
+        validated_at: str,
+    ) -> tuple[dict[str, Any], Optional[str]]:
+        """
+        Run test quality gates in a worktree.
+
+        Args:
+            worktree_path: Worktree to validate
+            validated_at: ISO timestamp to record on success
+
+        Returns:
+            (validation results, None) on success, or ({}, failure message)
+        """
+        runner = QualityGateRunner(self.settings, worktree_path)
+        results = runner.run_all_gates(stage="tests")
+
+        if not runner.all_gates_passed():
+            # Failed test gates - reject with specific feedback
+            failure_message = runner.get_failure_message()
+            logger.warning(f"Test gates failed in {worktree_path}: {failure_message}")
+            return {}, failure_message
+
+        logger.info(f"Test gates passed in {worktree_path}")
+        scores = {r.gate_type: r.score for r in results}
+        return {
+            "coverage_percent": scores.get(GateType.COVERAGE),
+            "mutation_score": scores.get(GateType.MUTATION),
+            "tests_passed": True,
+            "validated_at": validated_at,
+        }, None
+
+    def _record_validations(
+        self,
+        conn: sqlite3.Connection,
+        passed: dict[str, dict[str, Any]],
+        rejected: list[tuple[str, str]],
+        commit: bool = True,
+    ) -> None:
+        """
+        Write validation outcomes in one transaction.
+
+        Passed tasks store their results, move to in_docs and get a
+        SECURITY_SCAN event for the Refinery; rejected tasks go back to
+        in_progress with a REWORK_NEEDED event for the developer.
+
+        Args:
+            conn: Database connection
+            passed: Validation results keyed by task ID
+            rejected: (task_id, reason) pairs
+            commit: Commit at the end; pass False to leave the writes in
+                the caller's transaction
+        """
+        for task_id, reason in rejected:
+            logger.info(f"Rejecting validation for {task_id}: {reason}")
+
+        for task_id, validation_results in passed.items():
+            update_task_validation_results(conn, task_id, validation_results, commit=False)
+        update_task_statuses(
+            conn,
+            [(task_id, "in_docs") for task_id in passed]
+            + [(task_id, "in_progress") for task_id, _ in rejected],
+            commit=False,
+        )
+
+        events = [
+            ("refinery", "SECURITY_SCAN", {"task_id": task_id}) for task_id in passed
+        ]
+        events.extend(
+            ("developer", "REWORK_NEEDED", {"task_id": task_id, "reason": reason})
+            for task_id, reason in rejected
+        )
+        if events:
+            publish_events(conn, events, commit=commit)
+        elif commit:
+            conn.commit()
 
     def reject_validation(
         self,
@@ -146,19 +322,8 @@ class TesterAgent:
             task_id: Task to reject
             reason: Specific test failures or coverage issues
         """
-        logger.info(f"Rejecting validation for {task_id}: {reason}")
-
-        with get_db(self.db_path) as conn:
-            # Send back to in_progress
-            update_task_status(conn, task_id, "in_progress")
-
-            # Publish rework event
-            publish_event(
-                conn,
-                agent_id="developer",
-                event_type="REWORK_NEEDED",
-                payload={"task_id": task_id, "reason": reason},
-            )
+        with pooled_db(self.db_path) as conn:
+            self._record_validations(conn, {}, [(task_id, reason)])
 
     def run_coverage(self, source_dir: Path) -> dict[str, Any]:
         """
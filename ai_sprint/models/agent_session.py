@@ -4,8 +4,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+_VALID_AGENT_TYPES = frozenset({"manager", "cab", "refinery", "librarian", "developer", "tester"})
+_VALID_STATUSES = frozenset({"active", "crashed", "hung", "stuck"})
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentSession:
     """
     Track active agent processes for health monitoring.
@@ -29,14 +32,13 @@ class AgentSession:
 
     def __post_init__(self) -> None:
         """Validate agent_type and status values."""
-        valid_types = {"manager", "cab", "refinery", "librarian", "developer", "tester"}
-        if self.agent_type not in valid_types:
+        if self.agent_type not in _VALID_AGENT_TYPES:
             raise ValueError(
-                f"Invalid agent_type '{self.agent_type}'. Must be one of {valid_types}"
+                f"Invalid agent_type '{self.agent_type}'. "
+                f"Must be one of {sorted(_VALID_AGENT_TYPES)}"
             )
 
-        valid_statuses = {"active", "crashed", "hung", "stuck"}
-        if self.status not in valid_statuses:
+        if self.status not in _VALID_STATUSES:
             raise ValueError(
-                f"Invalid status '{self.status}'. Must be one of {valid_statuses}"
+                f"Invalid status '{self.status}'. Must be one of {sorted(_VALID_STATUSES)}"
             )
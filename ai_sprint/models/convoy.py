@@ -4,8 +4,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+_VALID_STATUSES = frozenset({"available", "in_progress", "done", "blocked"})
 
-@dataclass
+
+@dataclass(slots=True)
 class Convoy:
     """
     Bundle of related tasks (user story) assigned to single developer.
@@ -31,8 +33,7 @@ class Convoy:
 
     def __post_init__(self) -> None:
         """Validate status values."""
-        valid_statuses = {"available", "in_progress", "done", "blocked"}
-        if self.status not in valid_statuses:
+        if self.status not in _VALID_STATUSES:
             raise ValueError(
-                f"Invalid status '{self.status}'. Must be one of {valid_statuses}"
+                f"Invalid status '{self.status}'. Must be one of {sorted(_VALID_STATUSES)}"
             )
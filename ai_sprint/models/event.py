@@ -4,8 +4,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+_VALID_STATUSES = frozenset({"pending", "processing", "done", "failed"})
 
-@dataclass
+
+@dataclass(slots=True)
 class Event:
     """
     Message in agent communication queue.
@@ -26,8 +28,7 @@ class Event:
 
     def __post_init__(self) -> None:
         """Validate status values."""
-        valid_statuses = {"pending", "processing", "done", "failed"}
-        if self.status not in valid_statuses:
+        if self.status not in _VALID_STATUSES:
             raise ValueError(
-                f"Invalid status '{self.status}'. Must be one of {valid_statuses}"
+                f"Invalid status '{self.status}'. Must be one of {sorted(_VALID_STATUSES)}"
             )
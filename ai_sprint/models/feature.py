@@ -4,8 +4,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+_VALID_STATUSES = frozenset({"ready", "in_progress", "done", "failed"})
 
-@dataclass
+
+@dataclass(slots=True)
 class Feature:
     """
     Top-level work unit representing a complete feature to implement.
@@ -26,8 +28,7 @@ class Feature:
 
     def __post_init__(self) -> None:
         """Validate status values."""
-        valid_statuses = {"ready", "in_progress", "done", "failed"}
-        if self.status not in valid_statuses:
+        if self.status not in _VALID_STATUSES:
             raise ValueError(
-                f"Invalid status '{self.status}'. Must be one of {valid_statuses}"
+                f"Invalid status '{self.status}'. Must be one of {sorted(_VALID_STATUSES)}"
             )
@@ -4,8 +4,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+_VALID_STATUSES = frozenset({"todo", "in_progress", "in_review", "in_tests", "in_docs", "done"})
 
-@dataclass
+
+@dataclass(slots=True)
 class Task:
     """
     Individual work item with acceptance criteria.
@@ -39,8 +41,7 @@ class Task:
 
     def __post_init__(self) -> None:
         """Validate status values."""
-        valid_statuses = {"todo", "in_progress", "in_review", "in_tests", "in_docs", "done"}
-        if self.status not in valid_statuses:
+        if self.status not in _VALID_STATUSES:
             raise ValueError(
-                f"Invalid status '{self.status}'. Must be one of {valid_statuses}"
+                f"Invalid status '{self.status}'. Must be one of {sorted(_VALID_STATUSES)}"
             )
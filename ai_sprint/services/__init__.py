@@ -1,5 +1,7 @@
 """Service modules for AI Sprint."""
 
+from typing import TYPE_CHECKING, Any
+
 from ai_sprint.services.convoy_allocator import (
     allocate_next_convoy,
     check_convoy_dependencies_met,
@@ -7,24 +9,16 @@ from ai_sprint.services.convoy_allocator import (
     unblock_dependent_convoys,
     update_blocked_convoys_status,
 )
-from ai_sprint.services.worktree_manager import WorktreeManager
-from ai_sprint.services.session_manager import (
-    SessionManager,
-    capture_session_logs,
-    disable_pane_logging,
-    enable_pane_logging,
-    get_pane_content,
-    get_pane_log_path,
-    send_command_to_pane,
-    spawn_agent,
-)
 from ai_sprint.services.state_manager import (
+    ACTIVE_TASK_STATUSES,
     VALID_TASK_TRANSITIONS,
     acknowledge_event,
+    acknowledge_events,
     add_file_to_convoy,
     check_convoy_completion,
     check_feature_completion,
     check_file_overlap,
+    claim_next_task_atomic,
     claim_task_atomic,
     cleanup_feature,
     consume_events,
@@ -39,13 +33,18 @@ from ai_sprint.services.state_manager import (
     get_feature,
     get_pending_event_count,
     get_task,
+    get_tasks,
     increment_task_failure_count,
     initialize_database,
     list_convoys_by_feature,
     list_features_by_status,
+    list_task_ids_by_completion,
     list_tasks_by_convoy,
+    load_payload,
     migrate,
+    pooled_db,
     publish_event,
+    publish_events,
     reject_task,
     remove_file_from_convoy,
     transition_task_status,
@@ -53,12 +52,41 @@ from ai_sprint.services.state_manager import (
     update_convoy_status,
     update_feature_status,
     update_task_status,
+    update_task_statuses,
     update_task_validation_results,
     validate_convoy_files_no_overlap,
     validate_no_file_conflicts,
     validate_task_transition,
 )
 
+if TYPE_CHECKING:
+    from ai_sprint.services.session_manager import (
+        SessionManager,
+        agent_session_name,
+        capture_session_logs,
+        disable_pane_logging,
+        enable_pane_logging,
+        get_pane_content,
+        get_pane_log_path,
+        send_command_to_pane,
+        spawn_agent,
+    )
+    from ai_sprint.services.worktree_manager import WorktreeManager
+
+# Re-exports whose modules import libtmux or GitPython, resolved on first use
+_LAZY_EXPORTS = {
+    "WorktreeManager": "ai_sprint.services.worktree_manager",
+    "SessionManager": "ai_sprint.services.session_manager",
+    "agent_session_name": "ai_sprint.services.session_manager",
+    "capture_session_logs": "ai_sprint.services.session_manager",
+    "disable_pane_logging": "ai_sprint.services.session_manager",
+    "enable_pane_logging": "ai_sprint.services.session_manager",
+    "get_pane_content": "ai_sprint.services.session_manager",
+    "get_pane_log_path": "ai_sprint.services.session_manager",
+    "send_command_to_pane": "ai_sprint.services.session_manager",
+    "spawn_agent": "ai_sprint.services.session_manager",
+}
+
 __all__ = [
     # Convoy allocation
     "allocate_next_convoy",
@@ -70,6 +98,7 @@ __all__ = [
     "WorktreeManager",
     # Session management
     "SessionManager",
+    "agent_session_name",
     "capture_session_logs",
     "disable_pane_logging",
     "enable_pane_logging",
@@ -78,8 +107,11 @@ __all__ = [
     "send_command_to_pane",
     "spawn_agent",
     # State management - CRUD
+    "ACTIVE_TASK_STATUSES",
     "acknowledge_event",
+    "acknowledge_events",
     "add_file_to_convoy",
+    "claim_next_task_atomic",
     "claim_task_atomic",
     "consume_events",
     "create_convoy",
@@ -93,18 +125,24 @@ __all__ = [
     "get_feature",
     "get_pending_event_count",
     "get_task",
+    "get_tasks",
     "increment_task_failure_count",
     "initialize_database",
     "list_convoys_by_feature",
     "list_features_by_status",
+    "list_task_ids_by_completion",
     "list_tasks_by_convoy",
+    "load_payload",
     "migrate",
+    "pooled_db",
     "publish_event",
+    "publish_events",
     "remove_file_from_convoy",
     "update_convoy_files",
     "update_convoy_status",
     "update_feature_status",
     "update_task_status",
+    "update_task_statuses",
     "update_task_validation_results",
     # State management - State machine
     "VALID_TASK_TRANSITIONS",
@@ -118,3 +156,15 @@ __all__ = [
     "validate_no_file_conflicts",
     "validate_task_transition",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing ai_sprint.services.state_manager runs this package __init__,
+    # so keep tmux/git-backed services out of that path until they are used.
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    return getattr(importlib.import_module(module_name), name)
@@ -1,19 +1,26 @@
 """Convoy allocation logic for distributing work to developers."""
 
-import json
 import sqlite3
 from typing import Optional
 
 from ai_sprint.services.state_manager import (
     get_convoy,
     get_db,
-    list_convoys_by_feature,
-    update_convoy_status,
 )
 from ai_sprint.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Correlated filter matching a convoy with at least one dependency that is
+# not done; a dependency missing from convoys counts as not done
+UNMET_DEPENDENCY_SQL = """
+EXISTS (
+    SELECT 1 FROM convoy_dependencies cd
+    LEFT JOIN convoys dep ON dep.id = cd.dep_id
+    WHERE cd.convoy_id = convoys.id AND (dep.status IS NULL OR dep.status != 'done')
+)
+"""
+
 
 # =============================================================================
 # T055: FIFO convoy allocation
@@ -27,6 +34,10 @@ def allocate_next_convoy(
     """
     Allocate the next available convoy to an agent (FIFO order).
 
+    Picks the highest-priority, oldest available convoy whose dependencies
+    are all done and claims it in the same statement, so two agents can
+    never be handed the same convoy.
+
     Args:
         conn: Database connection
         feature_id: Feature identifier
@@ -35,31 +46,28 @@ def allocate_next_convoy(
     Returns:
         Convoy ID if allocated, None if no work available
     """
-    # Get all available convoys for this feature
-    convoys = list_convoys_by_feature(conn, feature_id, status="available")
-
-    if not convoys:
-        logger.debug(f"No available convoys for feature {feature_id}")
-        return None
-
-    # Sort by priority (P1, P2, P3) then creation time
-    sorted_convoys = sorted(
-        convoys,
-        key=lambda c: (c["priority"], c["created_at"]),
-    )
-
-    # Take first available convoy
-    convoy = sorted_convoys[0]
-    convoy_id = convoy["id"]
+    with conn:
+        row = conn.execute(
+            f"""
+            UPDATE convoys
+            SET status = 'in_progress', assignee = ?, started_at = datetime('now')
+            WHERE id = (
+                SELECT id FROM convoys
+                WHERE feature_id = ? AND status = 'available'
+                    AND NOT {UNMET_DEPENDENCY_SQL}
+                ORDER BY priority, created_at
+                LIMIT 1
+            )
+            RETURNING id
+            """,
+            (agent_id, feature_id),
+        ).fetchone()
 
-    # Check dependencies before allocating
-    if not check_convoy_dependencies_met(conn, convoy_id):
-        logger.info(f"Convoy {convoy_id} dependencies not met - skipping")
+    if row is None:
+        logger.debug(f"No available convoys with met dependencies for feature {feature_id}")
         return None
 
-    # Allocate convoy to agent
-    update_convoy_status(conn, convoy_id, "in_progress", assignee=agent_id)
-
+    convoy_id = row[0]
     logger.info(f"Allocated convoy {convoy_id} to agent {agent_id}")
     return convoy_id
 
@@ -82,33 +90,17 @@ def check_convoy_dependencies_met(
     Returns:
         True if all dependencies are done, False otherwise
     """
-    convoy = get_convoy(conn, convoy_id)
-    if not convoy:
-        return False
-
-    # Parse dependencies (JSON array)
-    dependencies_str = convoy["dependencies"]
-    if not dependencies_str:
-        return True  # No dependencies
+    row = conn.execute(
+        f"SELECT {UNMET_DEPENDENCY_SQL} FROM convoys WHERE id = ?",
+        (convoy_id,),
+    ).fetchone()
 
-    dependencies = json.loads(dependencies_str)
-
-    if not dependencies:
-        return True  # Empty dependencies list
-
-    # Check each dependency
-    for dep_id in dependencies:
-        dep_convoy = get_convoy(conn, dep_id)
-
-        if not dep_convoy:
-            logger.warning(f"Dependency convoy not found: {dep_id}")
-            return False
+    if row is None:
+        return False
 
-        if dep_convoy["status"] != "done":
-            logger.debug(
-                f"Convoy {convoy_id} blocked by {dep_id} (status: {dep_convoy['status']})"
-            )
-            return False
+    if row[0]:
+        logger.debug(f"Convoy {convoy_id} blocked by unfinished dependencies")
+        return False
 
     logger.debug(f"All dependencies met for convoy {convoy_id}")
     return True
@@ -128,30 +120,24 @@ def get_blocked_convoys(
     Returns:
         List of dicts with keys: convoy_id, blocked_by (list of convoy IDs)
     """
-    blocked = []
-
-    convoys = list_convoys_by_feature(conn, feature_id, status="available")
-
-    for convoy in convoys:
-        convoy_id = convoy["id"]
-
-        if not check_convoy_dependencies_met(conn, convoy_id):
-            # Find which dependencies are blocking
-            dependencies = json.loads(convoy["dependencies"] or "[]")
-            blocking_deps = []
-
-            for dep_id in dependencies:
-                dep_convoy = get_convoy(conn, dep_id)
-                if dep_convoy and dep_convoy["status"] != "done":
-                    blocking_deps.append(dep_id)
-
-            if blocking_deps:
-                blocked.append({
-                    "convoy_id": convoy_id,
-                    "blocked_by": blocking_deps,
-                })
+    rows = conn.execute(
+        """
+        SELECT convoys.id, group_concat(dep.id) AS blocked_by
+        FROM convoys
+        JOIN convoy_dependencies cd ON cd.convoy_id = convoys.id
+        JOIN convoys dep ON dep.id = cd.dep_id
+        WHERE convoys.feature_id = ? AND convoys.status = 'available'
+            AND dep.status != 'done'
+        GROUP BY convoys.id
+        ORDER BY convoys.priority
+        """,
+        (feature_id,),
+    )
 
-    return blocked
+    return [
+        {"convoy_id": convoy_id, "blocked_by": blocked_by.split(",")}
+        for convoy_id, blocked_by in rows
+    ]
 
 
 def update_blocked_convoys_status(
@@ -168,19 +154,23 @@ def update_blocked_convoys_status(
     Returns:
         Number of convoys marked as blocked
     """
-    count = 0
+    with conn:
+        blocked_ids = [
+            row[0]
+            for row in conn.execute(
+                f"""
+                UPDATE convoys SET status = 'blocked', assignee = NULL
+                WHERE feature_id = ? AND status = 'available' AND {UNMET_DEPENDENCY_SQL}
+                RETURNING id
+                """,
+                (feature_id,),
+            ).fetchall()
+        ]
 
-    convoys = list_convoys_by_feature(conn, feature_id, status="available")
+    for convoy_id in blocked_ids:
+        logger.info(f"Marked convoy {convoy_id} as blocked")
 
-    for convoy in convoys:
-        convoy_id = convoy["id"]
-
-        if not check_convoy_dependencies_met(conn, convoy_id):
-            update_convoy_status(conn, convoy_id, "blocked")
-            count += 1
-            logger.info(f"Marked convoy {convoy_id} as blocked")
-
-    return count
+    return len(blocked_ids)
 
 
 def unblock_dependent_convoys(
@@ -197,25 +187,26 @@ def unblock_dependent_convoys(
     Returns:
         Number of convoys unblocked
     """
-    count = 0
-
     # Get convoy's feature
     completed_convoy = get_convoy(conn, completed_convoy_id)
     if not completed_convoy:
         return 0
 
-    feature_id = completed_convoy["feature_id"]
-
-    # Find all blocked convoys in this feature
-    blocked_convoys = list_convoys_by_feature(conn, feature_id, status="blocked")
-
-    for convoy in blocked_convoys:
-        convoy_id = convoy["id"]
-
-        # Check if this convoy can now proceed
-        if check_convoy_dependencies_met(conn, convoy_id):
-            update_convoy_status(conn, convoy_id, "available")
-            count += 1
-            logger.info(f"Unblocked convoy {convoy_id}")
-
-    return count
+    # Blocked convoys in this feature whose dependencies are now all done
+    with conn:
+        unblocked_ids = [
+            row[0]
+            for row in conn.execute(
+                f"""
+                UPDATE convoys SET status = 'available', assignee = NULL
+                WHERE feature_id = ? AND status = 'blocked' AND NOT {UNMET_DEPENDENCY_SQL}
+                RETURNING id
+                """,
+                (completed_convoy["feature_id"],),
+            ).fetchall()
+        ]
+
+    for convoy_id in unblocked_ids:
+        logger.info(f"Unblocked convoy {convoy_id}")
+
+    return len(unblocked_ids)
@@ -9,13 +9,17 @@ This module implements health monitoring for all agents:
 
 import logging
 import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+import libtmux
 import psutil
 
 from ai_sprint.config.settings import Settings
+from ai_sprint.services.session_manager import agent_session_name
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,15 @@ logger = logging.getLogger(__name__)
 class HealthMonitor:
     """Monitor agent health and detect failures."""
 
+    # Seconds between writes of buffered heartbeats
+    HEARTBEAT_FLUSH_INTERVAL = 1.0
+    # Seconds between explicit WAL checkpoints from the flusher thread
+    WAL_CHECKPOINT_INTERVAL = 60.0
+    # Seconds a tmux session listing is reused before asking tmux again
+    TMUX_SESSIONS_TTL = 1.0
+    # Crash checks scan every active agent once per this many calls
+    CRASH_FULL_SCAN_TICKS = 5
+
     def __init__(self, db_path: Path, settings: Settings):
         """Initialize health monitor.
 
@@ -42,23 +55,152 @@ class HealthMonitor:
             seconds=settings.timeouts.task_max_duration_seconds
         )
 
+        # Latest heartbeat per agent, written out by the flusher thread
+        self._hb_buf: dict[str, str] = {}
+        self._hb_lock = threading.Lock()
+        self._hb_stop = threading.Event()
+        self._hb_thread: Optional[threading.Thread] = None
+
+        # One persistent connection per thread, see _get_db()
+        self._tls = threading.local()
+
+        # Shared tmux server handle and cached session names
+        self._tmux_server = libtmux.Server()
+        self._tmux_sessions: set[str] = set()
+        self._tmux_sessions_at: Optional[float] = None
+        self._tick_counter = 0
+
     def record_heartbeat(self, agent_id: str) -> None:
         """Record heartbeat for an agent.
 
+        The heartbeat is buffered and written within
+        HEARTBEAT_FLUSH_INTERVAL by a background thread, which batches
+        every agent's latest heartbeat into one transaction.
+
         Args:
             agent_id: Agent identifier (e.g., "dev-001")
         """
+        with self._hb_lock:
+            self._hb_buf[agent_id] = datetime.now().isoformat()
+            if self._hb_thread is None:
+                self._hb_stop.clear()
+                self._hb_thread = threading.Thread(
+                    target=self._flush_heartbeats_loop,
+                    name="heartbeat-flusher",
+                    daemon=True,
+                )
+                self._hb_thread.start()
+        logger.debug("Heartbeat recorded for %s", agent_id)
+
+    def flush_heartbeats(self) -> int:
+        """Write buffered heartbeats in a single transaction.
+
+        Returns:
+            Number of heartbeats written
+        """
+        with self._hb_lock:
+            pending, self._hb_buf = self._hb_buf, {}
+        if not pending:
+            return 0
+
         with self._get_db() as conn:
-            conn.execute(
+            conn.executemany(
                 """
                 UPDATE agent_sessions
                 SET last_heartbeat = ?
                 WHERE agent_id = ? AND status = 'active'
                 """,
-                (datetime.now().isoformat(), agent_id),
+                [(timestamp, agent_id) for agent_id, timestamp in pending.items()],
             )
-            conn.commit()
-            logger.debug(f"Heartbeat recorded for {agent_id}")
+        return len(pending)
+
+    def close(self) -> None:
+        """Stop the heartbeat flusher after writing what is buffered."""
+        with self._hb_lock:
+            thread, self._hb_thread = self._hb_thread, None
+        if thread is not None:
+            self._hb_stop.set()
+            thread.join()
+        self.flush_heartbeats()
+        self._close_db()
+
+    def _flush_heartbeats_loop(self) -> None:
+        """Flush buffered heartbeats on the thread's own connection.
+
+        Every WAL_CHECKPOINT_INTERVAL the loop also checkpoints the WAL,
+        so a monitor running for a whole sprint keeps the -wal file small.
+        """
+        mode = "TRUNCATE"
+        last_checkpoint = time.monotonic()
+        try:
+            while not self._hb_stop.wait(self.HEARTBEAT_FLUSH_INTERVAL):
+                try:
+                    self.flush_heartbeats()
+                    if time.monotonic() - last_checkpoint >= self.WAL_CHECKPOINT_INTERVAL:
+                        busy = self._checkpoint_wal(mode)
+                        # A busy TRUNCATE is retried as a non-blocking PASSIVE
+                        mode = "PASSIVE" if busy else "TRUNCATE"
+                        last_checkpoint = time.monotonic()
+                except sqlite3.Error as e:
+                    logger.error("Failed to flush heartbeats: %s", e)
+        finally:
+            self._close_db()
+
+    def _checkpoint_wal(self, mode: str) -> bool:
+        """Checkpoint the write-ahead log.
+
+        Args:
+            mode: Checkpoint mode (TRUNCATE or PASSIVE)
+
+        Returns:
+            True if readers or writers kept the checkpoint from completing
+        """
+        busy, log_frames, checkpointed = self._get_db().execute(
+            f"PRAGMA wal_checkpoint({mode})"
+        ).fetchone()
+        logger.debug(
+            "WAL checkpoint (%s): busy=%d log=%d checkpointed=%d",
+            mode,
+            busy,
+            log_frames,
+            checkpointed,
+        )
+        return busy != 0
+
+    def run_tick(
+        self, crashed: bool = True, hung: bool = True, stuck: bool = True
+    ) -> dict[str, list]:
+        """Run the selected health checks in one transaction.
+
+        Every check sees the same database snapshot and all status changes
+        commit together. Crash detection uses one tmux session listing
+        taken before the transaction starts.
+
+        Args:
+            crashed: Run crash detection
+            hung: Run hung agent detection
+            stuck: Run stuck task detection
+
+        Returns:
+            Dict with "crashed" and "hung" lists of agent IDs and a "stuck"
+            list of dicts with task_id, agent_id, duration_seconds
+        """
+        if hung:
+            # Buffered heartbeats must land before judging staleness
+            self.flush_heartbeats()
+        names = self._active_tmux_sessions() if crashed else set()
+        now = datetime.now()
+
+        conn = self._get_db()
+        with conn:
+            # Take the write lock up front: a deferred transaction that reads
+            # first could not upgrade if another writer committed meanwhile
+            conn.execute("BEGIN IMMEDIATE")
+            return {
+                "crashed": self._detect_crashed(conn, names, now) if crashed else [],
+                "hung": self._detect_hung(conn, now) if hung else [],
+                "stuck": self._detect_stuck(conn, now) if stuck else [],
+            }
 
     def check_crashed_agents(self) -> list[str]:
         """Detect agents with missing processes.
@@ -66,102 +208,176 @@ class HealthMonitor:
         Returns:
             List of agent IDs for crashed agents
         """
-        crashed = []
+        return self.run_tick(hung=False, stuck=False)["crashed"]
 
-        with self._get_db() as conn:
-            cursor = conn.execute(
+    def check_hung_agents(self) -> list[str]:
+        """Detect agents with no heartbeat for 5 minutes.
+
+        Returns:
+            List of agent IDs for hung agents
+        """
+        return self.run_tick(crashed=False, stuck=False)["hung"]
+
+    def check_stuck_tasks(self) -> list[dict]:
+        """Detect tasks exceeding maximum duration.
+
+        Returns:
+            List of dicts with task_id, agent_id, duration_seconds
+        """
+        return self.run_tick(crashed=False, hung=False)["stuck"]
+
+    def _detect_crashed(
+        self, conn: sqlite3.Connection, names: set[str], now: datetime
+    ) -> list[str]:
+        """Mark active agents without a tmux session as crashed.
+
+        Agents that sent a heartbeat within half the heartbeat threshold are
+        skipped, except on every CRASH_FULL_SCAN_TICKS-th call, which checks
+        the whole active set so a silent process death is still caught.
+
+        Args:
+            conn: Connection with an open transaction
+            names: Running tmux session names
+            now: Time of this check
+
+        Returns:
+            List of agent IDs for crashed agents
+        """
+        self._tick_counter += 1
+        if self._tick_counter % self.CRASH_FULL_SCAN_TICKS == 0:
+            active_agents = conn.execute(
                 """
-                SELECT agent_id, status
+                SELECT agent_id
                 FROM agent_sessions
                 WHERE status = 'active'
                 """
             )
-            active_agents = cursor.fetchall()
+        else:
+            recent = (now - self.heartbeat_threshold / 2).isoformat()
+            active_agents = conn.execute(
+                """
+                SELECT agent_id
+                FROM agent_sessions
+                WHERE status = 'active'
+                AND (last_heartbeat IS NULL OR last_heartbeat < ?)
+                """,
+                (recent,),
+            )
+
+        crashed = [
+            agent_id
+            for (agent_id,) in active_agents
+            if agent_session_name(agent_id) not in names
+        ]
+        if not crashed:
+            return crashed
+
+        crashed_at = now.isoformat()
+        conn.executemany(
+            """
+            UPDATE agent_sessions
+            SET status = 'crashed', crashed_at = ?
+            WHERE agent_id = ?
+            """,
+            [(crashed_at, agent_id) for agent_id in crashed],
+        )
 
-        for row in active_agents:
-            agent_id = row[0]
-            if not self._is_process_running(agent_id):
-                crashed.append(agent_id)
-                self._mark_crashed(agent_id)
-                logger.warning(f"Agent {agent_id} crashed - process not found")
+        for agent_id in crashed:
+            logger.warning("Agent %s crashed - process not found", agent_id)
 
         return crashed
 
-    def check_hung_agents(self) -> list[str]:
-        """Detect agents with no heartbeat for 5 minutes.
+    def _detect_hung(self, conn: sqlite3.Connection, now: datetime) -> list[str]:
+        """Mark active agents with a stale heartbeat as hung.
+
+        Stale agents are found and marked hung by one UPDATE ... RETURNING,
+        which also reports how long each has been silent.
+
+        Args:
+            conn: Connection with an open transaction
+            now: Time of this check
 
         Returns:
             List of agent IDs for hung agents
         """
-        hung = []
-        threshold_time = datetime.now() - self.hung_threshold
-
-        with self._get_db() as conn:
-            cursor = conn.execute(
-                """
-                SELECT agent_id, last_heartbeat
-                FROM agent_sessions
-                WHERE status = 'active'
-                AND last_heartbeat < ?
-                """,
-                (threshold_time.isoformat(),),
-            )
-            stale_agents = cursor.fetchall()
+        threshold_time = now - self.hung_threshold
+        stale_agents = conn.execute(
+            """
+            UPDATE agent_sessions
+            SET status = 'hung'
+            WHERE status = 'active'
+            AND last_heartbeat < ?
+            RETURNING agent_id,
+                (julianday(?) - julianday(last_heartbeat)) * 86400.0
+            """,
+            (threshold_time.isoformat(), now.isoformat()),
+        )
 
-        for row in stale_agents:
-            agent_id = row[0]
-            last_heartbeat = datetime.fromisoformat(row[1])
-            elapsed = datetime.now() - last_heartbeat
+        hung = []
+        for agent_id, silent_seconds in stale_agents:
             hung.append(agent_id)
-            self._mark_hung(agent_id)
             logger.warning(
-                f"Agent {agent_id} hung - no heartbeat for {elapsed.total_seconds():.0f}s"
+                "Agent %s hung - no heartbeat for %.0fs", agent_id, silent_seconds
             )
 
         return hung
 
-    def check_stuck_tasks(self) -> list[dict]:
-        """Detect tasks exceeding maximum duration.
+    def _detect_stuck(self, conn: sqlite3.Connection, now: datetime) -> list[dict]:
+        """Mark assignees of over-long tasks as stuck.
+
+        Rows are streamed from the cursor, then all affected agents are
+        marked with a single UPDATE. Durations are computed by SQLite, so
+        no timestamps are parsed here.
+
+        Args:
+            conn: Connection with an open transaction
+            now: Time of this check
 
         Returns:
             List of dicts with task_id, agent_id, duration_seconds
         """
-        stuck = []
-        threshold_time = datetime.now() - self.task_timeout
-
-        with self._get_db() as conn:
-            cursor = conn.execute(
-                """
-                SELECT t.id, t.assignee, t.started_at
-                FROM tasks t
-                WHERE t.status IN ('in_progress', 'in_review', 'in_tests', 'in_docs')
-                AND t.started_at < ?
-                """,
-                (threshold_time.isoformat(),),
-            )
-            long_tasks = cursor.fetchall()
-
-        for row in long_tasks:
-            task_id = row[0]
-            agent_id = row[1]
-            started_at = datetime.fromisoformat(row[2])
-            duration = datetime.now() - started_at
+        threshold = (now - self.task_timeout).isoformat()
+        long_tasks = conn.execute(
+            """
+            SELECT t.id, t.assignee,
+                (julianday(?) - julianday(t.started_at)) * 86400.0
+            FROM tasks t
+            WHERE t.status IN ('in_progress', 'in_review', 'in_tests', 'in_docs')
+            AND t.started_at < ?
+            """,
+            (now.isoformat(), threshold),
+        )
 
+        stuck = []
+        for task_id, agent_id, duration_seconds in long_tasks:
             stuck.append(
                 {
                     "task_id": task_id,
                     "agent_id": agent_id,
-                    "duration_seconds": duration.total_seconds(),
+                    "duration_seconds": duration_seconds,
                 }
             )
 
-            # Mark agent as stuck
             if agent_id:
-                self._mark_stuck(agent_id, task_id)
                 logger.warning(
-                    f"Task {task_id} stuck on {agent_id} for {duration.total_seconds():.0f}s"
+                    "Task %s stuck on %s for %.0fs", task_id, agent_id, duration_seconds
                 )
 
+        if any(task["agent_id"] for task in stuck):
+            # Mark agents as stuck
+            conn.execute(
+                """
+                UPDATE agent_sessions
+                SET status = 'stuck'
+                WHERE agent_id IN (
+                    SELECT assignee FROM tasks
+                    WHERE status IN ('in_progress', 'in_review', 'in_tests', 'in_docs')
+                    AND started_at < ?
+                )
+                """,
+                (threshold,),
+            )
+
         return stuck
 
     def get_agent_status(self, agent_id: str) -> Optional[str]:
@@ -193,62 +409,58 @@ class HealthMonitor:
         Returns:
             True if process found, False otherwise
         """
-        try:
-            # Check for tmux session with agent name
-            import libtmux
+        return agent_session_name(agent_id) in self._active_tmux_sessions()
 
-            server = libtmux.Server()
-            session = server.sessions.get(
-                session_name=f"ai-sprint-{agent_id}", default=None
-            )
-            return session is not None
-        except Exception as e:
-            logger.error(f"Error checking process for {agent_id}: {e}")
-            return False
+    def _active_tmux_sessions(self) -> set[str]:
+        """Get names of running tmux sessions.
 
-    def _mark_crashed(self, agent_id: str) -> None:
-        """Mark agent as crashed in database."""
-        with self._get_db() as conn:
-            conn.execute(
-                """
-                UPDATE agent_sessions
-                SET status = 'crashed', crashed_at = ?
-                WHERE agent_id = ?
-                """,
-                (datetime.now().isoformat(), agent_id),
-            )
-            conn.commit()
+        One `tmux list-sessions` call serves every agent checked within
+        TMUX_SESSIONS_TTL seconds.
 
-    def _mark_hung(self, agent_id: str) -> None:
-        """Mark agent as hung in database."""
-        with self._get_db() as conn:
-            conn.execute(
-                """
-                UPDATE agent_sessions
-                SET status = 'hung'
-                WHERE agent_id = ?
-                """,
-                (agent_id,),
-            )
-            conn.commit()
+        Returns:
+            Set of session names (empty if tmux could not be queried)
+        """
+        now = time.monotonic()
+        if (
+            self._tmux_sessions_at is not None
+            and now - self._tmux_sessions_at < self.TMUX_SESSIONS_TTL
+        ):
+            return self._tmux_sessions
 
-    def _mark_stuck(self, agent_id: str, task_id: str) -> None:
-        """Mark agent as stuck on a task."""
-        with self._get_db() as conn:
-            conn.execute(
-                """
-                UPDATE agent_sessions
-                SET status = 'stuck'
-                WHERE agent_id = ?
-                """,
-                (agent_id,),
-            )
-            conn.commit()
+        try:
+            names = {session.name for session in self._tmux_server.sessions}
+        except Exception as e:
+            logger.error("Error listing tmux sessions: %s", e)
+            names = set()
+
+        self._tmux_sessions = names
+        self._tmux_sessions_at = now
+        return names
 
     def _get_db(self) -> sqlite3.Connection:
-        """Get database connection with proper settings."""
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
+        """Get this thread's database connection, opening it on first use.
+
+        The connection stays open for the monitor's lifetime, so pragmas
+        are applied once per thread instead of on every call. Callers use
+        `with conn:` for transaction scope only; it does not close.
+        """
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")  # Durable enough under WAL
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA busy_timeout=30000")
+            conn.execute("PRAGMA wal_autocheckpoint=1000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")  # ~20 MB
+            conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+            self._tls.conn = conn
         return conn
+
+    def _close_db(self) -> None:
+        """Close this thread's connection, if it has one."""
+        conn = getattr(self._tls, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._tls.conn = None
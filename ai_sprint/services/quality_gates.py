@@ -9,6 +9,7 @@ This module implements quality gates that enforce code standards:
 import json
 import logging
 import subprocess
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -632,9 +633,10 @@ class QualityGateRunner:
                 findings = json.loads(result.stdout)
                 results = findings.get("results", [])
 
-                # Count by severity
-                critical = sum(1 for r in results if r.get("extra", {}).get("severity") == "ERROR")
-                high = sum(1 for r in results if r.get("extra", {}).get("severity") == "WARNING")
+                # Count by severity in one pass
+                severities = Counter(r.get("extra", {}).get("severity") for r in results)
+                critical = severities["ERROR"]
+                high = severities["WARNING"]
 
                 if critical > 0 or high > 0:
                     return GateResult(
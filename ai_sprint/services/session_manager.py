@@ -1,13 +1,32 @@
 """Session management with tmux integration."""
 
-import libtmux
+import itertools
+import shlex
 from pathlib import Path
 from typing import Optional
 
+import libtmux
+
 from ai_sprint.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Name prefix for idle pre-created sessions waiting in the pool
+SPARE_SESSION_PREFIX = "ai-sprint-spare-"
+
+
+def agent_session_name(agent_id: str) -> str:
+    """
+    Get the tmux session name for an agent.
+
+    Args:
+        agent_id: Agent identifier (e.g., "dev-001")
+
+    Returns:
+        Session name the agent runs in
+    """
+    return agent_id
+
 
 # =============================================================================
 # T031: tmux session creation/destruction
@@ -16,14 +35,66 @@ logger = get_logger(__name__)
 class SessionManager:
     """Manage tmux sessions for AI Sprint agents."""
 
-    def __init__(self, server: Optional[libtmux.Server] = None):
+    def __init__(
+        self,
+        server: Optional[libtmux.Server] = None,
+        pool_size: int = 0,
+    ):
         """
         Initialize session manager.
 
         Args:
             server: tmux server instance (creates new if None)
+            pool_size: Number of idle sessions to keep warm for reuse
         """
         self.server = server or libtmux.Server()
+        self.pool_size = pool_size
+        self._spares: list[libtmux.Session] = []
+        self._spare_ids = itertools.count(1)
+
+    def warm_pool(self) -> None:
+        """Pre-create idle sessions until the pool holds pool_size of them.
+
+        Spare sessions left behind by an earlier manager are reset and
+        adopted first; any beyond pool_size are killed.
+        """
+        pooled = {spare.name for spare in self._spares}
+        for session in self.server.sessions:
+            if not session.name.startswith(SPARE_SESSION_PREFIX) or session.name in pooled:
+                continue
+            if len(self._spares) < self.pool_size:
+                logger.info(f"Adopting leftover tmux session: {session.name}")
+                self._reset_session(session)
+                self._spares.append(session)
+            else:
+                logger.info(f"Killing leftover tmux session: {session.name}")
+                session.kill()
+
+        while len(self._spares) < self.pool_size:
+            self._spares.append(
+                self.server.new_session(session_name=self._next_spare_name(), attach=False)
+            )
+
+    def _next_spare_name(self) -> str:
+        """Get an unused name for a spare session."""
+        while True:
+            name = f"{SPARE_SESSION_PREFIX}{next(self._spare_ids)}"
+            if not self.server.has_session(name):
+                return name
+
+    def _reset_session(self, session: libtmux.Session) -> None:
+        """Strip a session back to one pane running a fresh shell.
+
+        The pane is respawned rather than interrupted, since a hung agent
+        may ignore SIGINT and would otherwise receive the next agent's
+        commands.
+        """
+        windows = session.windows
+        for window in windows[1:]:
+            window.kill()
+        for pane in windows[0].panes[1:]:
+            pane.kill()
+        windows[0].panes[0].cmd("respawn-pane", "-k")
 
     def create_session(self, session_name: str, working_dir: Optional[str] = None) -> libtmux.Session:
         """
@@ -43,6 +114,15 @@ class SessionManager:
         if self.server.has_session(session_name):
             raise ValueError(f"Session '{session_name}' already exists")
 
+        if self._spares:
+            # Reuse a warm session instead of forking a new one
+            session = self._spares.pop()
+            logger.info(f"Reusing tmux session {session.name} as {session_name}")
+            session.rename_session(session_name)
+            if working_dir:
+                session.windows[0].panes[0].send_keys(f"cd {shlex.quote(working_dir)}")
+            return session
+
         logger.info(f"Creating tmux session: {session_name}")
 
         # Create session with optional working directory
@@ -68,6 +148,14 @@ class SessionManager:
         if not session:
             raise ValueError(f"Session '{session_name}' not found")
 
+        if len(self._spares) < self.pool_size:
+            # Park the session in the pool rather than killing it
+            logger.info(f"Recycling tmux session: {session_name}")
+            self._reset_session(session)
+            session.rename_session(self._next_spare_name())
+            self._spares.append(session)
+            return
+
         logger.info(f"Destroying tmux session: {session_name}")
         session.kill_session()
 
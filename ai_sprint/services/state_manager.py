@@ -1,43 +1,148 @@
 """State management with SQLite database."""
 
+import atexit
+import json
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Generator, Optional
+from typing import Any, Generator, Optional, Union
 
 from ai_sprint.utils.logging import get_logger
 
+try:
+    import orjson
+except ImportError:  # Optional "fast" extra
+    orjson = None
+
 logger = get_logger(__name__)
 
 
 # T012: Database connection helper with WAL mode
+def _open_connection(expanded_path: Path, read_only: bool) -> sqlite3.Connection:
+    """
+    Open and configure a database connection.
+
+    Args:
+        expanded_path: Resolved path to SQLite database file
+        read_only: Open with mode=ro in autocommit mode
+
+    Returns:
+        Configured connection with row factory set to sqlite3.Row
+    """
+    if read_only:
+        conn = sqlite3.connect(
+            f"{expanded_path.absolute().as_uri()}?mode=ro",
+            uri=True,
+            timeout=30.0,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+    else:
+        expanded_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(expanded_path),
+            timeout=30.0,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+    conn.row_factory = sqlite3.Row  # Dict-like access
+
+    if not read_only:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # Durable enough under WAL
+        conn.execute("PRAGMA foreign_keys=ON")
+
+    # Serve reads from a memory-mapped file and a larger page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+    return conn
+
+
 @contextmanager
-def get_db(db_path: str = "~/.ai-sprint/beads.db") -> Generator[sqlite3.Connection, None, None]:
+def get_db(
+    db_path: str = "~/.ai-sprint/beads.db",
+    read_only: bool = False,
+) -> Generator[sqlite3.Connection, None, None]:
     """
     Get database connection with WAL mode and foreign keys enabled.
 
     Args:
         db_path: Path to SQLite database file
+        read_only: Open with mode=ro in autocommit mode (for status/reporting
+            paths); never takes a write lock or creates the database
 
     Yields:
         Database connection with row factory set to sqlite3.Row
     """
-    expanded_path = Path(db_path).expanduser()
-    expanded_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = _open_connection(Path(db_path).expanduser(), read_only)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+# Idle connections kept per (database, mode) for long-running agents
+POOL_MAX_IDLE = 3
+
+_POOLS: dict[tuple[Path, bool], "queue.Queue[sqlite3.Connection]"] = {}
+_POOLS_LOCK = threading.Lock()
 
-    conn = sqlite3.connect(
-        str(expanded_path),
-        timeout=30.0,
-        check_same_thread=False,
-    )
-    conn.row_factory = sqlite3.Row  # Dict-like access
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+
+@atexit.register
+def _close_pools() -> None:
+    """Close idle pooled connections so the last one checkpoints the WAL."""
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+
+@contextmanager
+def pooled_db(
+    db_path: str | Path = "~/.ai-sprint/beads.db",
+    read_only: bool = False,
+) -> Generator[sqlite3.Connection, None, None]:
+    """
+    Borrow a connection from the process-wide pool for this database.
+
+    Same configuration as get_db(), but the connection is returned to the
+    pool instead of being closed, so polling agents skip the file, WAL and
+    SHM setup (and keep their statement cache) on every call.
+
+    Args:
+        db_path: Path to SQLite database file
+        read_only: Borrow a mode=ro autocommit connection
+
+    Yields:
+        Database connection with row factory set to sqlite3.Row
+    """
+    key = (Path(db_path).expanduser(), read_only)
+    with _POOLS_LOCK:
+        pool = _POOLS.setdefault(key, queue.Queue(maxsize=POOL_MAX_IDLE))
+
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = _open_connection(*key)
 
     try:
         yield conn
     finally:
-        conn.close()
+        # Never hand a half-finished transaction to the next borrower
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
 
 
 # T013: Schema creation
@@ -98,7 +203,7 @@ CREATE TABLE IF NOT EXISTS events (
     id TEXT PRIMARY KEY,
     agent_id TEXT NOT NULL,
     event_type TEXT NOT NULL,
-    payload TEXT NOT NULL,
+    payload TEXT NOT NULL,  -- JSON; UTF-8 BLOB when written via orjson
     status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'processing', 'done', 'failed')),
     created_at TEXT NOT NULL DEFAULT (datetime('now')),
     processed_at TEXT
@@ -135,6 +240,50 @@ CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
 CREATE INDEX IF NOT EXISTS idx_agent_sessions_status ON agent_sessions(status);
 CREATE INDEX IF NOT EXISTS idx_agent_sessions_heartbeat ON agent_sessions(last_heartbeat);
 """
+# Indexes for the manager's ready-feature poll and developer state recovery.
+# Both queries bind their status values as parameters, which SQLite cannot
+# match against a partial index, so these index every row.
+ACTIVE_WORK_INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_features_status_created ON features(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_assignee_started ON tasks(assignee, started_at);
+"""
+
+# Lets the Refinery read a convoy's merge queue already in completion order
+MERGE_QUEUE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_tasks_convoy_status_completed ON tasks(convoy_id, status, completed_at);
+"""
+
+# Normalized convoy dependencies, so dependency checks are joins rather
+# than JSON parsing. convoys.dependencies stays as the original record;
+# the INSERT backfills existing rows when migrating.
+CONVOY_DEPENDENCIES_SQL = """
+CREATE TABLE IF NOT EXISTS convoy_dependencies (
+    convoy_id TEXT NOT NULL REFERENCES convoys(id),
+    dep_id TEXT NOT NULL,
+    PRIMARY KEY (convoy_id, dep_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_convoy_dependencies_dep ON convoy_dependencies(dep_id);
+
+INSERT OR IGNORE INTO convoy_dependencies (convoy_id, dep_id)
+SELECT convoys.id, deps.value FROM convoys, json_each(convoys.dependencies) AS deps;
+"""
+
+# Partial indexes for the HealthMonitor's hung-agent and stuck-task checks.
+# Those queries spell the status values out literally, so the planner can
+# use indexes over only the active agents and in-flight tasks. ANALYZE
+# fills sqlite_stat1 so these are preferred over the plain status indexes.
+HEALTH_CHECK_INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_agent_sessions_active_hb ON agent_sessions(last_heartbeat) WHERE status = 'active';
+CREATE INDEX IF NOT EXISTS idx_tasks_inflight_started ON tasks(started_at) WHERE status IN ('in_progress', 'in_review', 'in_tests', 'in_docs');
+ANALYZE;
+"""
+
+# Task statuses in which a task is still owned by its assignee
+ACTIVE_TASK_STATUSES = ("in_progress", "in_review", "in_tests", "in_docs")
+
+# Timestamp column stamped when a task enters a status
+TASK_STATUS_TIMESTAMPS = {"in_progress": "started_at", "done": "completed_at"}
 
 
 def create_schema(conn: sqlite3.Connection) -> None:
@@ -146,12 +295,20 @@ def create_schema(conn: sqlite3.Connection) -> None:
     """
     conn.executescript(SCHEMA_SQL)
     conn.executescript(INDEXES_SQL)
+    conn.executescript(ACTIVE_WORK_INDEXES_SQL)
+    conn.executescript(MERGE_QUEUE_INDEX_SQL)
+    conn.executescript(CONVOY_DEPENDENCIES_SQL)
+    conn.executescript(HEALTH_CHECK_INDEXES_SQL)
     conn.commit()
 
 
 # T014: Schema migration support
 MIGRATIONS: dict[int, str] = {
     1: SCHEMA_SQL + INDEXES_SQL,
+    2: ACTIVE_WORK_INDEXES_SQL,
+    3: MERGE_QUEUE_INDEX_SQL,
+    4: CONVOY_DEPENDENCIES_SQL,
+    5: HEALTH_CHECK_INDEXES_SQL,
 }
 
 
@@ -347,6 +504,11 @@ def create_convoy(
             status,
         ),
     )
+    if dependencies:
+        conn.executemany(
+            "INSERT OR IGNORE INTO convoy_dependencies (convoy_id, dep_id) VALUES (?, ?)",
+            [(convoy_id, dep_id) for dep_id in dependencies],
+        )
     conn.commit()
 
 
@@ -503,6 +665,28 @@ def get_task(conn: sqlite3.Connection, task_id: str) -> Optional[sqlite3.Row]:
     ).fetchone()
 
 
+def get_tasks(conn: sqlite3.Connection, task_ids: list[str]) -> dict[str, sqlite3.Row]:
+    """
+    Get several tasks by ID with a single query.
+
+    Args:
+        conn: Database connection
+        task_ids: Task identifiers
+
+    Returns:
+        Task rows keyed by ID; unknown IDs are absent
+    """
+    if not task_ids:
+        return {}
+
+    placeholders = ",".join("?" * len(task_ids))
+    rows = conn.execute(
+        f"SELECT * FROM tasks WHERE id IN ({placeholders})",
+        task_ids,
+    )
+    return {row["id"]: row for row in rows}
+
+
 def claim_task_atomic(
     conn: sqlite3.Connection,
     task_id: str,
@@ -553,11 +737,55 @@ def claim_task_atomic(
         raise
 
 
+def claim_next_task_atomic(
+    conn: sqlite3.Connection,
+    convoy_id: str,
+    assignee: str,
+) -> Optional[str]:
+    """
+    Atomically claim the oldest unassigned todo task in a convoy.
+
+    Selection and claim happen in one UPDATE ... RETURNING statement
+    (SQLite 3.35+), so competing developers never retry against a task
+    another agent has just taken.
+
+    Args:
+        conn: Database connection
+        convoy_id: Convoy to claim from
+        assignee: Agent ID claiming the task
+
+    Returns:
+        Claimed task ID, or None if no task was available
+    """
+    try:
+        row = conn.execute(
+            """
+            UPDATE tasks
+            SET status = 'in_progress', assignee = ?, started_at = datetime('now')
+            WHERE id = (
+                SELECT id FROM tasks
+                WHERE convoy_id = ? AND status = 'todo' AND assignee IS NULL
+                ORDER BY created_at
+                LIMIT 1
+            )
+            RETURNING id
+            """,
+            (assignee, convoy_id),
+        ).fetchone()
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    return row["id"] if row else None
+
+
 def update_task_status(
     conn: sqlite3.Connection,
     task_id: str,
     status: str,
     assignee: Optional[str] = None,
+    commit: bool = True,
 ) -> None:
     """
     Update task status with timestamp.
@@ -567,12 +795,10 @@ def update_task_status(
         task_id: Task identifier
         status: New status (todo, in_progress, in_review, in_tests, in_docs, done)
         assignee: Optional assignee update
+        commit: Commit immediately; pass False to batch several updates
+            into the caller's transaction
     """
-    timestamp_field = None
-    if status == "in_progress":
-        timestamp_field = "started_at"
-    elif status == "done":
-        timestamp_field = "completed_at"
+    timestamp_field = TASK_STATUS_TIMESTAMPS.get(status)
 
     if timestamp_field:
         if assignee:
@@ -604,13 +830,47 @@ def update_task_status(
                 "UPDATE tasks SET status = ? WHERE id = ?",
                 (status, task_id),
             )
-    conn.commit()
+    if commit:
+        conn.commit()
+
+
+def update_task_statuses(
+    conn: sqlite3.Connection,
+    updates: list[tuple[str, str]],
+    commit: bool = True,
+) -> None:
+    """
+    Update several task statuses with one executemany per status.
+
+    Timestamps are set as in update_task_status().
+
+    Args:
+        conn: Database connection
+        updates: (task_id, status) pairs
+        commit: Commit immediately; pass False to leave the updates in
+            the caller's transaction
+    """
+    by_status: dict[str, list[tuple[str, str]]] = {}
+    for task_id, status in updates:
+        by_status.setdefault(status, []).append((status, task_id))
+
+    for status, rows in by_status.items():
+        timestamp_field = TASK_STATUS_TIMESTAMPS.get(status)
+        if timestamp_field:
+            sql = f"UPDATE tasks SET status = ?, {timestamp_field} = datetime('now') WHERE id = ?"
+        else:
+            sql = "UPDATE tasks SET status = ? WHERE id = ?"
+        conn.executemany(sql, rows)
+
+    if commit:
+        conn.commit()
 
 
 def update_task_validation_results(
     conn: sqlite3.Connection,
     task_id: str,
     validation_results: dict[str, Any],
+    commit: bool = True,
 ) -> None:
     """
     Update task validation results (coverage, mutation, security).
@@ -619,6 +879,8 @@ def update_task_validation_results(
         conn: Database connection
         task_id: Task identifier
         validation_results: Validation results dictionary
+        commit: Commit immediately; pass False to batch several updates
+            into the caller's transaction
     """
     import json
 
@@ -626,7 +888,8 @@ def update_task_validation_results(
         "UPDATE tasks SET validation_results = ? WHERE id = ?",
         (json.dumps(validation_results), task_id),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def increment_task_failure_count(
@@ -645,20 +908,16 @@ def increment_task_failure_count(
     Returns:
         New failure count
     """
-    conn.execute(
+    row = conn.execute(
         """
         UPDATE tasks
         SET failure_count = failure_count + 1, failure_reason = ?
         WHERE id = ?
+        RETURNING failure_count
         """,
         (failure_reason, task_id),
-    )
-    conn.commit()
-
-    row = conn.execute(
-        "SELECT failure_count FROM tasks WHERE id = ?",
-        (task_id,),
     ).fetchone()
+    conn.commit()
 
     return row["failure_count"] if row else 0
 
@@ -691,10 +950,78 @@ def list_tasks_by_convoy(
         ).fetchall()
 
 
+def list_task_ids_by_completion(
+    conn: sqlite3.Connection,
+    convoy_id: str,
+    status: str,
+) -> list[str]:
+    """
+    List a convoy's task IDs in a status, oldest completion first.
+
+    Ordering comes straight from idx_tasks_convoy_status_completed;
+    tasks without a completion time come last.
+
+    Args:
+        conn: Database connection
+        convoy_id: Convoy identifier
+        status: Status filter
+
+    Returns:
+        List of task IDs
+    """
+    cursor = conn.execute(
+        """
+        SELECT id FROM tasks
+        WHERE convoy_id = ? AND status = ?
+        ORDER BY completed_at NULLS LAST
+        """,
+        (convoy_id, status),
+    )
+    return [row[0] for row in cursor]
+
+
 # =============================================================================
 # T030: Event queue operations (publish, consume, ack)
 # =============================================================================
 
+# Rows per multi-row events INSERT; 4 parameters each keeps a statement
+# under the 999-variable limit of older SQLite builds
+EVENT_INSERT_CHUNK_ROWS = 200
+
+
+def _dumps_payload(payload: dict[str, Any]) -> Union[bytes, str]:
+    """
+    Serialize an event payload to JSON, using orjson when installed.
+
+    orjson's UTF-8 bytes are bound as-is (stored as a BLOB) rather than
+    decoded to str; load_payload() accepts either form.
+
+    Args:
+        payload: JSON-serializable event data
+
+    Returns:
+        Compact JSON as bytes (orjson) or str (stdlib json)
+    """
+    if orjson is None:
+        return json.dumps(payload, separators=(",", ":"))
+    return orjson.dumps(payload)
+
+
+def load_payload(raw: Union[bytes, str]) -> dict[str, Any]:
+    """
+    Decode an events.payload value, whether stored as BLOB or TEXT.
+
+    Args:
+        raw: Payload column value
+
+    Returns:
+        Event payload dict
+    """
+    if orjson is None:
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
 def publish_event(
     conn: sqlite3.Connection,
     agent_id: str,
@@ -713,7 +1040,6 @@ def publish_event(
     Returns:
         Event ID (UUID)
     """
-    import json
     import uuid
 
     event_id = str(uuid.uuid4())
@@ -722,12 +1048,52 @@ def publish_event(
         INSERT INTO events (id, agent_id, event_type, payload, status)
         VALUES (?, ?, ?, ?, 'pending')
         """,
-        (event_id, agent_id, event_type, json.dumps(payload)),
+        (event_id, agent_id, event_type, _dumps_payload(payload)),
     )
     conn.commit()
     return event_id
 
 
+def publish_events(
+    conn: sqlite3.Connection,
+    events: list[tuple[str, str, dict[str, Any]]],
+    commit: bool = True,
+) -> list[str]:
+    """
+    Publish several events with multi-row INSERTs and a single commit.
+
+    Args:
+        conn: Database connection
+        events: (agent_id, event_type, payload) tuples
+        commit: Commit immediately; pass False to leave the inserts in
+            the caller's transaction
+
+    Returns:
+        Event IDs (UUIDs) in input order
+    """
+    import uuid
+
+    event_ids = []
+    params: list[Union[bytes, str]] = []
+    for agent_id, event_type, payload in events:
+        event_id = str(uuid.uuid4())
+        event_ids.append(event_id)
+        params.extend((event_id, agent_id, event_type, _dumps_payload(payload)))
+
+    # Multi-row INSERTs, chunked to stay under SQLite's bound-parameter limit
+    chunk = EVENT_INSERT_CHUNK_ROWS * 4
+    for start in range(0, len(params), chunk):
+        chunk_params = params[start:start + chunk]
+        values = ",".join(["(?, ?, ?, ?, 'pending')"] * (len(chunk_params) // 4))
+        conn.execute(
+            f"INSERT INTO events (id, agent_id, event_type, payload, status) VALUES {values}",
+            chunk_params,
+        )
+    if commit:
+        conn.commit()
+    return event_ids
+
+
 def consume_events(
     conn: sqlite3.Connection,
     agent_id: str,
@@ -797,6 +1163,34 @@ def acknowledge_event(
     conn.commit()
 
 
+def acknowledge_events(
+    conn: sqlite3.Connection,
+    event_ids: list[str],
+    success: bool = True,
+) -> None:
+    """
+    Acknowledge a batch of events in a single transaction.
+
+    Args:
+        conn: Database connection
+        event_ids: Event identifiers
+        success: True for done, False for failed
+    """
+    if not event_ids:
+        return
+
+    status = "done" if success else "failed"
+    with conn:
+        conn.executemany(
+            """
+            UPDATE events
+            SET status = ?, processed_at = datetime('now')
+            WHERE id = ?
+            """,
+            [(status, event_id) for event_id in event_ids],
+        )
+
+
 def get_pending_event_count(
     conn: sqlite3.Connection,
     agent_id: str,
@@ -1,11 +1,25 @@
 """Utility modules for AI Sprint."""
 
-from ai_sprint.utils.git import WorktreeManager, validate_git_repo
+from typing import TYPE_CHECKING, Any
+
 from ai_sprint.utils.logging import get_logger, setup_logging
 
+if TYPE_CHECKING:
+    from ai_sprint.utils.git import WorktreeManager, validate_git_repo
+
 __all__ = [
     "WorktreeManager",
     "validate_git_repo",
     "get_logger",
     "setup_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve the git helpers on first use so importing ai_sprint.utils.logging
+    # does not pull in GitPython.
+    if name in ("WorktreeManager", "validate_git_repo"):
+        from ai_sprint.utils import git
+
+        return getattr(git, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -133,7 +133,7 @@ main() {
 
         # Validate TOML syntax
         if command -v python3 &> /dev/null; then
-            if python3 -c "import toml; toml.load(open('$config_path'))" 2> /dev/null; then
+            if python3 -c "import tomllib; tomllib.load(open('$config_path', 'rb'))" 2> /dev/null; then
                 echo "  TOML syntax: valid"
             else
                 echo -e "${RED}✗${NC} TOML syntax: INVALID"